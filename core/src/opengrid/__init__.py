@@ -11,19 +11,23 @@ from opengrid.models import (
     Shot,
     Task,
     Version,
+    Change,
     User,
     Status,
     AssetType,
 )
 from opengrid.studio import Studio
+from opengrid.async_studio import AsyncStudio
 
 __all__ = [
     "Studio",
+    "AsyncStudio",
     "Project",
     "Asset",
     "Shot",
     "Task",
     "Version",
+    "Change",
     "User",
     "Status",
     "AssetType",
@@ -0,0 +1,114 @@
+"""Asyncio facade for Studio."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar, Union
+
+from opengrid.studio import Studio
+
+T = TypeVar("T")
+
+
+class AsyncStudio:
+    """Awaitable wrapper around a Studio.
+
+    Every public Studio method is available under the same name as a
+    coroutine that runs on a bounded thread pool, so SQLite I/O never blocks
+    the event loop. Each worker thread gets its own read connection from the
+    Studio's pool. `iter_*` methods become async iterators that fetch one
+    chunk per executor call.
+
+    `Studio.transaction()` is bound to the thread that opens it and is not
+    exposed; put multi-step writes in a plain function and pass it to `run`.
+
+    Example:
+        async with AsyncStudio("my_studio.db") as studio:
+            project = await studio.get_project("MYFILM")
+            async for task in studio.iter_tasks(status="review"):
+                ...
+    """
+
+    def __init__(
+        self,
+        studio: Union[Studio, str, Path] = ":memory:",
+        max_workers: Optional[int] = None,
+        **studio_options: Any,
+    ) -> None:
+        """Wrap a Studio, opening one if given a database path.
+
+        Args:
+            studio: Existing Studio, or a database path to open
+            max_workers: Size of the thread pool (default: CPU count + 4, max 32)
+            studio_options: Extra Studio arguments when opening from a path
+        """
+        if not isinstance(studio, Studio):
+            studio = Studio(studio, **studio_options)
+        self.studio = studio
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4),
+            thread_name_prefix="opengrid",
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the executor and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def close(self) -> None:
+        """Close the Studio and shut down the thread pool."""
+        await self.run(self.studio.close)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> AsyncStudio:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name == "transaction":
+            raise AttributeError(name)
+        attr = getattr(self.studio, name)
+        if not callable(attr):
+            return attr
+        if name.startswith("iter_"):
+            wrapper = self._wrap_iterator(name, attr)
+        else:
+            wrapper = self._wrap_method(name, attr)
+        # Cache the wrapper so later lookups skip __getattr__.
+        setattr(self, name, wrapper)
+        return wrapper
+
+    # The wrappers look the method up on every call so they pick up
+    # per-instance replacements such as Studio.enable_instrumentation().
+    def _wrap_method(self, name: str, method: Callable[..., T]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> T:
+            return await self.run(getattr(self.studio, name), *args, **kwargs)
+        return call
+
+    def _wrap_iterator(
+        self, name: str, method: Callable[..., Any]
+    ) -> Callable[..., AsyncIterator[Any]]:
+        @functools.wraps(method)
+        async def iterate(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            chunk_size = kwargs.get("chunk_size", 1000)
+            iterator = await self.run(getattr(self.studio, name), *args, **kwargs)
+            try:
+                while True:
+                    chunk = await self.run(list, itertools.islice(iterator, chunk_size))
+                    if not chunk:
+                        return
+                    for item in chunk:
+                        yield item
+            finally:
+                await self.run(iterator.close)
+        return iterate
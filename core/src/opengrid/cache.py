@@ -0,0 +1,86 @@
+"""In-process entity cache for Studio."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, in the spirit of `functools.lru_cache`."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class EntityCache:
+    """Bounded LRU identity map.
+
+    Repeated lookups of the same key return the same model instance until
+    it is evicted or invalidated. Only writes made through the owning
+    Studio invalidate entries; changes from other processes are not seen.
+
+    `epoch` counts writes to the cache. A reader takes it before querying
+    the database and passes it to `put`, which drops the row if any write
+    happened in between, since that row may predate it.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = 0
+
+    @property
+    def epoch(self) -> int:
+        """Number of writes, invalidations and clears so far."""
+        return self._epoch
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached entity for key, or None."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, epoch: Optional[int] = None) -> None:
+        """Store an entity, evicting the least recently used if full.
+
+        Writes pass no epoch and always win. Reads pass the epoch they saw
+        before querying and are ignored if the cache was written since.
+        """
+        with self._lock:
+            if epoch is None:
+                self._epoch += 1
+            elif epoch != self._epoch:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
@@ -190,19 +190,16 @@ if HAS_CLI:
     ) -> None:
         """List tasks in a project."""
         with Studio(get_db_path()) as studio:
-            # Get all assets in project
-            assets = studio.find_assets(project=project_code)
+            tasks = studio.find_project_tasks(project_code, status=status, assignee=assignee)
             
             table = Table(title=f"Tasks in {project_code}")
-            table.add_column("Asset", style="cyan")
+            table.add_column("Entity", style="cyan")
             table.add_column("Task")
             table.add_column("Status")
             table.add_column("Assignee")
             
-            for asset in assets:
-                tasks = studio.find_tasks(entity=asset, status=status, assignee=assignee)
-                for t in tasks:
-                    table.add_row(asset.name, t.name, t.status, t.assignee or "-")
+            for entity_name, t in tasks:
+                table.add_row(entity_name, t.name, t.status, t.assignee or "-")
             
             console.print(table)
 
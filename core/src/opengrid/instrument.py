@@ -0,0 +1,140 @@
+"""Opt-in query timing for Studio."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator, Iterator, Optional
+
+logger = logging.getLogger("opengrid")
+
+
+@dataclass(slots=True)
+class CallRecord:
+    """One timed Studio method call."""
+    method: str
+    args: tuple[str, ...]  # type names of the arguments, not their values
+    elapsed: float  # seconds
+    rows: int  # items returned (1 for a single entity or scalar, 0 for None)
+    statements: list[str] = field(default_factory=list)  # SQL with ? placeholders, no values
+    error: Optional[str] = None  # exception type name if the call raised
+
+    def __str__(self) -> str:
+        args = ", ".join(self.args)
+        text = f"{self.method}({args}) {self.elapsed * 1000:.1f} ms, {self.rows} rows"
+        return f"{text}, raised {self.error}" if self.error else text
+
+
+class Instrumentation:
+    """Ring buffer of recent Studio calls and the SQL each one issued.
+
+    SQL text is captured as Studio passes it to SQLite, with `?`
+    placeholders: like argument values, bound values are never recorded.
+    Statements run by triggers are not listed, and at most `MAX_STATEMENTS`
+    are kept per call. Calls slower than `slow_ms` are also logged to the
+    "opengrid" logger.
+    """
+
+    MAX_STATEMENTS = 50
+
+    def __init__(self, capacity: int = 1000, slow_ms: Optional[float] = None) -> None:
+        self.records: deque[CallRecord] = deque(maxlen=capacity)
+        self.slow_ms = slow_ms
+        self._local = threading.local()
+
+    def trace(self, statement: str) -> None:
+        """Trace callback: attach a statement to the innermost call in progress."""
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            statements = stack[-1].statements
+            if len(statements) < self.MAX_STATEMENTS:
+                statements.append(statement)
+
+    def wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Return a timed version of a bound Studio method.
+
+        Calls that raise are recorded too, with `error` set. Generators
+        (the `iter_*` methods) are recorded once they are exhausted or
+        closed, with the time spent producing items and the number yielded.
+        """
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            record = CallRecord(
+                name,
+                tuple(type(a).__name__ for a in args)
+                + tuple(f"{k}={type(v).__name__}" for k, v in kwargs.items()),
+                0.0,
+                0,
+            )
+            result = None
+            try:
+                result = self._step(record, method, *args, **kwargs)
+            except BaseException as exc:
+                record.error = type(exc).__name__
+                raise
+            finally:
+                if not inspect.isgenerator(result):
+                    self._finish(record)
+            if inspect.isgenerator(result):
+                return self._timed_iter(record, result)
+            if isinstance(result, (list, tuple, dict)):
+                record.rows = len(result)
+            else:
+                record.rows = 0 if result is None else 1
+            return result
+        return timed
+
+    def _step(self, record: CallRecord, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call func with record as the current call, adding to its elapsed time."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record.elapsed += time.perf_counter() - start
+            stack.pop()
+
+    def _timed_iter(
+        self, record: CallRecord, iterator: Generator[Any, None, None]
+    ) -> Iterator[Any]:
+        # Each step may run on a different thread (AsyncStudio hands chunks
+        # to its executor), so the call stack is looked up per step.
+        try:
+            while True:
+                try:
+                    item = self._step(record, next, iterator)
+                except StopIteration:
+                    return
+                record.rows += 1
+                yield item
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            record.error = type(exc).__name__
+            raise
+        finally:
+            iterator.close()
+            self._finish(record)
+
+    def _finish(self, record: CallRecord) -> None:
+        self.records.append(record)
+        if self.slow_ms is not None and record.elapsed * 1000 >= self.slow_ms:
+            logger.warning(
+                "Slow Studio call: %s; SQL: %s", record, "; ".join(record.statements)
+            )
+
+    def slowest(self, n: int = 10) -> list[CallRecord]:
+        """The n slowest calls still in the buffer."""
+        return sorted(self.records, key=lambda r: r.elapsed, reverse=True)[:n]
+
+    def clear(self) -> None:
+        """Drop all records."""
+        self.records.clear()
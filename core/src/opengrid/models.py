@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 
 class Status(str, Enum):
@@ -28,7 +29,72 @@ class AssetType(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+def _decode_metadata(raw: str) -> dict[str, Any]:
+    # Most rows carry the default empty object; skip the JSON parser for them.
+    if raw == "{}":
+        return {}
+    return json.loads(raw)
+
+
+class _Lazy:
+    """Slot that may hold raw database text, decoded on first read.
+    
+    Studio stores ISO timestamps and metadata JSON on the model as-is, so
+    callers that never look at these fields never pay for parsing them.
+    Any str assigned to the attribute is treated as raw text.
+    """
+    
+    def __init__(self, slot: Any, decode: Callable[[str], Any]) -> None:
+        self.slot = slot
+        self.decode = decode
+    
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if value.__class__ is str:
+            value = self.decode(value)
+            self.slot.__set__(obj, value)
+        return value
+    
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+
+
+class _LazyList(_Lazy):
+    """Relationship slot whose list is only allocated when first read."""
+    
+    def __init__(self, slot: Any) -> None:
+        super().__init__(slot, list)
+    
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if value is None:
+            value = []
+            self.slot.__set__(obj, value)
+        return value
+
+
+def _lazy(*lists: str, **decoders: Callable[[str], Any]) -> Callable[[type], type]:
+    """Wrap the slots of a `dataclass(slots=True)` in lazy attributes.
+    
+    Args:
+        lists: Relationship fields allocated on first access
+        decoders: Fields holding raw text, mapped to their decoder
+    """
+    def wrap(cls: type) -> type:
+        for name in lists:
+            setattr(cls, name, _LazyList(cls.__dict__[name]))
+        for name, decode in decoders.items():
+            setattr(cls, name, _Lazy(cls.__dict__[name], decode))
+        return cls
+    return wrap
+
+
+@_lazy(created_at=datetime.fromisoformat, metadata=_decode_metadata)
+@dataclass(slots=True)
 class Project:
     """A production project."""
     id: int
@@ -37,13 +103,14 @@ class Project:
     status: str = "active"
     description: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = "{}"  # decoded into a fresh dict on first read
     
     def __str__(self) -> str:
         return f"Project({self.code})"
 
 
-@dataclass
+@_lazy("tasks", created_at=datetime.fromisoformat, metadata=_decode_metadata)
+@dataclass(slots=True)
 class Asset:
     """A production asset."""
     id: int
@@ -54,17 +121,18 @@ class Asset:
     description: Optional[str] = None
     thumbnail: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = "{}"  # decoded into a fresh dict on first read
     
-    # Relationships (populated when queried)
-    project: Optional[Project] = None
-    tasks: list[Task] = field(default_factory=list)
+    # Relationships (populated when queried with `include`; not compared)
+    project: Optional[Project] = field(default=None, compare=False)
+    tasks: list[Task] = field(default=None, compare=False)  # allocated on first read
     
     def __str__(self) -> str:
         return f"Asset({self.name})"
 
 
-@dataclass
+@_lazy("tasks", created_at=datetime.fromisoformat, metadata=_decode_metadata)
+@dataclass(slots=True)
 class Shot:
     """A shot in a sequence."""
     id: int
@@ -77,11 +145,11 @@ class Shot:
     description: Optional[str] = None
     thumbnail: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = "{}"  # decoded into a fresh dict on first read
     
     # Relationships
-    project: Optional[Project] = None
-    tasks: list[Task] = field(default_factory=list)
+    project: Optional[Project] = field(default=None, compare=False)
+    tasks: list[Task] = field(default=None, compare=False)  # allocated on first read
     
     @property
     def duration(self) -> int:
@@ -92,7 +160,13 @@ class Shot:
         return f"Shot({self.name})"
 
 
-@dataclass
+@_lazy(
+    "versions",
+    due_date=datetime.fromisoformat,
+    created_at=datetime.fromisoformat,
+    metadata=_decode_metadata,
+)
+@dataclass(slots=True)
 class Task:
     """A task on an asset or shot."""
     id: int
@@ -104,17 +178,18 @@ class Task:
     due_date: Optional[datetime] = None
     priority: int = 50  # 0-100
     created_at: datetime = field(default_factory=datetime.now)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = "{}"  # decoded into a fresh dict on first read
     
     # Relationships
-    entity: Optional[Asset | Shot] = None
-    versions: list[Version] = field(default_factory=list)
+    entity: Optional[Asset | Shot] = field(default=None, compare=False)
+    versions: list[Version] = field(default=None, compare=False)  # allocated on first read
     
     def __str__(self) -> str:
         return f"Task({self.name})"
 
 
-@dataclass
+@_lazy(created_at=datetime.fromisoformat, metadata=_decode_metadata)
+@dataclass(slots=True)
 class Version:
     """A published version of a task."""
     id: int
@@ -126,10 +201,10 @@ class Version:
     notes: Optional[str] = None
     created_by: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = "{}"  # decoded into a fresh dict on first read
     
     # Relationships
-    task: Optional[Task] = None
+    task: Optional[Task] = field(default=None, compare=False)
     
     @property
     def version_string(self) -> str:
@@ -140,7 +215,21 @@ class Version:
         return f"Version({self.version_string})"
 
 
-@dataclass
+@dataclass(slots=True)
+class Change:
+    """An entry in the change feed: one row inserted, updated or deleted."""
+    seq: int  # position in the feed; increases with every write
+    entity_type: str  # "project", "asset", "shot", "task" or "version"
+    entity_id: int
+    op: str  # "insert", "update" or "delete"
+    project_id: Optional[int] = None
+    
+    def __str__(self) -> str:
+        return f"Change({self.seq}: {self.op} {self.entity_type} {self.entity_id})"
+
+
+@_lazy(created_at=datetime.fromisoformat, metadata=_decode_metadata)
+@dataclass(slots=True)
 class User:
     """A user in the system."""
     id: int
@@ -150,7 +239,7 @@ class User:
     role: str = "artist"  # artist, lead, supervisor, admin
     active: bool = True
     created_at: datetime = field(default_factory=datetime.now)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = "{}"  # decoded into a fresh dict on first read
     
     def __str__(self) -> str:
         return f"User({self.username})"
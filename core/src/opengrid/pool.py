@@ -0,0 +1,259 @@
+"""SQLite connection management for Studio."""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# RETURNING and UPSERT without a conflict target arrived in SQLite 3.35.
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+
+class _TracedConnection(sqlite3.Connection):
+    """Connection that reports the SQL text of each execute call.
+
+    Unlike `set_trace_callback`, which sees statements with bound values
+    inlined, `trace` receives the text as passed in, with its `?`
+    placeholders, and is not called for statements run by triggers.
+    """
+
+    trace: Optional[Callable[[str], None]] = None
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        if self.trace is not None:
+            self.trace(sql)
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters: Iterable[Any], /) -> sqlite3.Cursor:
+        if self.trace is not None:
+            self.trace(sql)
+        return super().executemany(sql, parameters)
+
+
+class _Reader:
+    """A thread's read connection, held in its thread-local storage.
+
+    Thread-local storage is dropped when the thread exits, and a finalizer
+    on this holder then closes the connection, so short-lived threads do
+    not leave connections open until the pool is closed.
+    """
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _release_reader(
+    readers: set[sqlite3.Connection], lock: threading.Lock, conn: sqlite3.Connection
+) -> None:
+    with lock:
+        readers.discard(conn)
+    conn.close()
+
+
+class ConnectionPool:
+    """Per-thread read connections plus a single writer connection.
+
+    File databases run in WAL mode, so readers never block on the writer and
+    each thread gets its own connection for queries, closed when the thread
+    exits. All writes go through one dedicated connection guarded by a lock.
+
+    WAL is paired with `synchronous = NORMAL`: commits do not wait for an
+    fsync, so the last transactions before a power loss or OS crash may be
+    rolled back on recovery. The database itself stays consistent, and an
+    application crash loses nothing.
+
+    In-memory databases cannot be shared between connections, so there the
+    writer connection is used for everything.
+    """
+
+    def __init__(self, database: str, timeout: float = 30.0, retries: int = 5) -> None:
+        """Open the writer connection.
+
+        Args:
+            database: Path to SQLite database, or ":memory:" for in-memory
+            timeout: Seconds to wait on a locked database before failing
+            retries: Extra attempts to start a write transaction while
+                another process holds the write lock
+
+        Raises:
+            RuntimeError: If the SQLite library Python is linked against is
+                older than MIN_SQLITE_VERSION
+        """
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            required = ".".join(map(str, MIN_SQLITE_VERSION))
+            raise RuntimeError(
+                f"opengrid requires SQLite {required} or newer, "
+                f"but Python is linked against SQLite {sqlite3.sqlite_version}"
+            )
+        self.database = database
+        self.timeout = timeout
+        self.retries = retries
+        self.shared = database == ":memory:"
+
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._readers: set[sqlite3.Connection] = set()
+        self._readers_lock = threading.Lock()
+        self._closed = False
+
+        # Called after any rollback, e.g. to drop caches filled from rows
+        # that no longer exist.
+        self.rollback_hooks: list[Callable[[], None]] = []
+        self._trace: Optional[Callable[[str], None]] = None
+
+        self._writer = self._connect()
+        if not self.shared:
+            self._writer.execute("PRAGMA journal_mode = WAL")
+            self._writer.execute("PRAGMA synchronous = NORMAL")
+
+    def _connect(self) -> _TracedConnection:
+        conn = sqlite3.connect(
+            self.database,
+            timeout=self.timeout,
+            check_same_thread=False,
+            isolation_level=None,
+            factory=_TracedConnection,
+        )
+        conn.trace = self._trace
+        return conn
+
+    def set_trace_callback(self, trace: Optional[Callable[[str], None]]) -> None:
+        """Pass the SQL text of every execute call, on every connection, to `trace`.
+
+        Statements are reported as written, with `?` placeholders; bound
+        values are never passed to `trace`.
+        """
+        self._trace = trace
+        with self._write_lock:
+            self._writer.trace = trace
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.trace = trace
+
+    def _reader(self) -> sqlite3.Connection:
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON")
+            reader = self._local.reader = _Reader(conn)
+            with self._readers_lock:
+                self._readers.add(conn)
+            weakref.finalize(reader, _release_reader, self._readers, self._readers_lock, conn)
+        return reader.conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for queries.
+
+        Inside a write on the same thread this yields the writer connection,
+        so uncommitted changes stay visible to the caller.
+        """
+        if self.shared or getattr(self._local, "depth", 0):
+            with self._write_lock:
+                yield self._writer
+        else:
+            yield self._reader()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Run a block on the writer connection inside one transaction.
+
+        Commits on success and rolls back if the block raises. Nested calls
+        on the same thread become savepoints of the outer transaction, so
+        nothing is committed until the outermost block exits.
+        """
+        with self._write_lock:
+            depth = getattr(self._local, "depth", 0)
+            savepoint = f"sp_{depth}"
+            if depth:
+                self._writer.execute(f"SAVEPOINT {savepoint}")
+                pending = self._local.pending
+            else:
+                self._begin()
+                pending = self._local.pending = []
+            mark = len(pending)
+            self._local.depth = depth + 1
+            try:
+                yield self._writer
+            except BaseException:
+                if self._writer.in_transaction:
+                    if depth:
+                        self._writer.execute(f"ROLLBACK TO {savepoint}")
+                        self._writer.execute(f"RELEASE {savepoint}")
+                    else:
+                        self._writer.execute("ROLLBACK")
+                del pending[mark:]
+                for hook in self.rollback_hooks:
+                    hook()
+                raise
+            else:
+                if depth:
+                    self._writer.execute(f"RELEASE {savepoint}")
+                else:
+                    self._writer.execute("COMMIT")
+                    for callback in pending:
+                        callback()
+                    pending.clear()
+            finally:
+                self._local.depth = depth
+
+    @property
+    def writing(self) -> bool:
+        """True while the current thread is inside `write()`."""
+        return bool(getattr(self._local, "depth", 0))
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run `callback` once the current thread's writes are committed.
+
+        Outside a write it runs immediately. Inside one it waits for the
+        outermost COMMIT and is dropped if the enclosing transaction or
+        savepoint rolls back, so shared caches never hold rows other
+        threads cannot see yet.
+        """
+        if self.writing:
+            self._local.pending.append(callback)
+        else:
+            callback()
+
+    def _begin(self) -> None:
+        # IMMEDIATE takes the write lock up front, so once it succeeds the
+        # block cannot fail with SQLITE_BUSY halfway through. If the busy
+        # timeout runs out under heavy contention, back off and try again.
+        for attempt in range(self.retries + 1):
+            try:
+                self._writer.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) or attempt == self.retries:
+                    raise
+                time.sleep(random.uniform(0, 0.05 * 2 ** attempt))
+
+    def close(self) -> None:
+        """Close the writer and every read connection."""
+        self._closed = True
+        with self._readers_lock:
+            readers = list(self._readers)
+            self._readers.clear()
+        for conn in readers:
+            conn.close()
+        self._local = threading.local()
+        with self._write_lock:
+            if not self.shared:
+                # Refresh planner statistics for the indexes we actually used.
+                # Best effort: with other processes writing, the ANALYZE this
+                # may run can fail to upgrade to a write lock, and the next
+                # close will get another chance.
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                except sqlite3.OperationalError:
+                    pass
+            self._writer.close()
@@ -2,13 +2,532 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import re
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Collection, Iterable, Iterator, Optional, Union
 
-from opengrid.models import Project, Asset, Shot, Task, Version
+from opengrid.cache import CacheInfo, EntityCache
+from opengrid.instrument import Instrumentation
+from opengrid.models import Project, Asset, Shot, Task, Version, Change
+from opengrid.pool import ConnectionPool
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    code TEXT UNIQUE NOT NULL,
+    status TEXT DEFAULT 'active',
+    description TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    asset_type TEXT NOT NULL,
+    status TEXT DEFAULT 'waiting',
+    description TEXT,
+    thumbnail TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    FOREIGN KEY (project_id) REFERENCES projects(id),
+    UNIQUE (project_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS shots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL,
+    sequence TEXT NOT NULL,
+    name TEXT NOT NULL,
+    frame_start INTEGER DEFAULT 1001,
+    frame_end INTEGER DEFAULT 1100,
+    status TEXT DEFAULT 'waiting',
+    description TEXT,
+    thumbnail TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    FOREIGN KEY (project_id) REFERENCES projects(id),
+    UNIQUE (project_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity_type TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT DEFAULT 'waiting',
+    assignee TEXT,
+    due_date TEXT,
+    priority INTEGER DEFAULT 50,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    project_id INTEGER,  -- of the asset or shot, kept by trg_tasks_project_*
+    UNIQUE (entity_type, entity_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL,
+    version_number INTEGER NOT NULL,
+    status TEXT DEFAULT 'pending_review',
+    path TEXT,
+    thumbnail TEXT,
+    notes TEXT,
+    created_by TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    FOREIGN KEY (task_id) REFERENCES tasks(id),
+    UNIQUE (task_id, version_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_assets_project ON assets(project_id);
+CREATE INDEX IF NOT EXISTS idx_shots_project ON shots(project_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_entity ON tasks(entity_type, entity_id);
+CREATE INDEX IF NOT EXISTS idx_versions_task ON versions(task_id);
+
+-- Filters used by find_*/count_*, the CLI and the REST routes. Every index
+-- ends in the implicit rowid, so keyset pages (id > ? ORDER BY id) within
+-- one key are read in order without a sort. core/tests/test_query_plans.py
+-- checks that no filter combination falls back to a table scan.
+CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status);
+CREATE INDEX IF NOT EXISTS idx_assets_project_type ON assets(project_id, asset_type);
+CREATE INDEX IF NOT EXISTS idx_assets_project_status ON assets(project_id, status);
+CREATE INDEX IF NOT EXISTS idx_assets_type ON assets(asset_type);
+CREATE INDEX IF NOT EXISTS idx_assets_status ON assets(status);
+CREATE INDEX IF NOT EXISTS idx_shots_project_sequence ON shots(project_id, sequence);
+CREATE INDEX IF NOT EXISTS idx_shots_sequence ON shots(sequence);
+CREATE INDEX IF NOT EXISTS idx_shots_status ON shots(status);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks(assignee);
+CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
+CREATE INDEX IF NOT EXISTS idx_versions_status ON versions(status);
+CREATE INDEX IF NOT EXISTS idx_versions_created_by ON versions(created_by);
+
+-- A task's project is that of its asset or shot. It is copied onto the
+-- task so one project's tasks are a single range of idx_tasks_project.
+CREATE TRIGGER IF NOT EXISTS trg_tasks_project_insert AFTER INSERT ON tasks BEGIN
+    UPDATE tasks SET project_id = (
+        SELECT project_id FROM assets WHERE new.entity_type = 'asset' AND id = new.entity_id
+        UNION ALL
+        SELECT project_id FROM shots WHERE new.entity_type = 'shot' AND id = new.entity_id
+    ) WHERE id = new.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tasks_project_update
+AFTER UPDATE OF entity_type, entity_id ON tasks BEGIN
+    UPDATE tasks SET project_id = (
+        SELECT project_id FROM assets WHERE new.entity_type = 'asset' AND id = new.entity_id
+        UNION ALL
+        SELECT project_id FROM shots WHERE new.entity_type = 'shot' AND id = new.entity_id
+    ) WHERE id = new.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_tasks_project AFTER UPDATE OF project_id ON assets BEGIN
+    UPDATE tasks SET project_id = new.project_id
+        WHERE entity_type = 'asset' AND entity_id = new.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_tasks_project AFTER UPDATE OF project_id ON shots BEGIN
+    UPDATE tasks SET project_id = new.project_id
+        WHERE entity_type = 'shot' AND entity_id = new.id;
+END;
+
+-- Row counts per table, kept current by triggers so unfiltered counts are
+-- a primary-key lookup. Seeded from COUNT(*) when the table is created
+-- (see _BACKFILL).
+CREATE TABLE IF NOT EXISTS entity_counts (
+    entity_type TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_count_insert AFTER INSERT ON projects BEGIN
+    UPDATE entity_counts SET count = count + 1 WHERE entity_type = 'projects';
+END;
+CREATE TRIGGER IF NOT EXISTS trg_projects_count_delete AFTER DELETE ON projects BEGIN
+    UPDATE entity_counts SET count = count - 1 WHERE entity_type = 'projects';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_assets_count_insert AFTER INSERT ON assets BEGIN
+    UPDATE entity_counts SET count = count + 1 WHERE entity_type = 'assets';
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_count_delete AFTER DELETE ON assets BEGIN
+    UPDATE entity_counts SET count = count - 1 WHERE entity_type = 'assets';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_shots_count_insert AFTER INSERT ON shots BEGIN
+    UPDATE entity_counts SET count = count + 1 WHERE entity_type = 'shots';
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_count_delete AFTER DELETE ON shots BEGIN
+    UPDATE entity_counts SET count = count - 1 WHERE entity_type = 'shots';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_insert AFTER INSERT ON tasks BEGIN
+    UPDATE entity_counts SET count = count + 1 WHERE entity_type = 'tasks';
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_delete AFTER DELETE ON tasks BEGIN
+    UPDATE entity_counts SET count = count - 1 WHERE entity_type = 'tasks';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_versions_count_insert AFTER INSERT ON versions BEGIN
+    UPDATE entity_counts SET count = count + 1 WHERE entity_type = 'versions';
+END;
+CREATE TRIGGER IF NOT EXISTS trg_versions_count_delete AFTER DELETE ON versions BEGIN
+    UPDATE entity_counts SET count = count - 1 WHERE entity_type = 'versions';
+END;
+
+-- Per-project counts of assets by type, shots by sequence and tasks by
+-- name, split by status, for dashboards. Kept current by the triggers
+-- below; rows that drop to zero stay and are skipped when read. A task
+-- counts toward the project of its asset or shot.
+CREATE TABLE IF NOT EXISTS status_rollup (
+    project_id INTEGER NOT NULL,
+    entity_type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (project_id, entity_type, category, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_assets_rollup_insert AFTER INSERT ON assets BEGIN
+    INSERT INTO status_rollup
+        VALUES (new.project_id, 'asset', new.asset_type, coalesce(new.status, ''), 1)
+        ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_rollup_update
+AFTER UPDATE OF project_id, asset_type, status ON assets BEGIN
+    UPDATE status_rollup SET count = count - 1
+        WHERE project_id = old.project_id AND entity_type = 'asset'
+        AND category = old.asset_type AND status = coalesce(old.status, '');
+    INSERT INTO status_rollup
+        VALUES (new.project_id, 'asset', new.asset_type, coalesce(new.status, ''), 1)
+        ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_rollup_delete AFTER DELETE ON assets BEGIN
+    UPDATE status_rollup SET count = count - 1
+        WHERE project_id = old.project_id AND entity_type = 'asset'
+        AND category = old.asset_type AND status = coalesce(old.status, '');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_shots_rollup_insert AFTER INSERT ON shots BEGIN
+    INSERT INTO status_rollup
+        VALUES (new.project_id, 'shot', new.sequence, coalesce(new.status, ''), 1)
+        ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_rollup_update
+AFTER UPDATE OF project_id, sequence, status ON shots BEGIN
+    UPDATE status_rollup SET count = count - 1
+        WHERE project_id = old.project_id AND entity_type = 'shot'
+        AND category = old.sequence AND status = coalesce(old.status, '');
+    INSERT INTO status_rollup
+        VALUES (new.project_id, 'shot', new.sequence, coalesce(new.status, ''), 1)
+        ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_rollup_delete AFTER DELETE ON shots BEGIN
+    UPDATE status_rollup SET count = count - 1
+        WHERE project_id = old.project_id AND entity_type = 'shot'
+        AND category = old.sequence AND status = coalesce(old.status, '');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO status_rollup
+        SELECT project_id, 'task', new.name, coalesce(new.status, ''), 1 FROM assets
+        WHERE new.entity_type = 'asset' AND id = new.entity_id
+        UNION ALL
+        SELECT project_id, 'task', new.name, coalesce(new.status, ''), 1 FROM shots
+        WHERE new.entity_type = 'shot' AND id = new.entity_id
+        ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_update
+AFTER UPDATE OF entity_type, entity_id, name, status ON tasks BEGIN
+    UPDATE status_rollup SET count = count - 1
+        WHERE entity_type = 'task' AND category = old.name AND status = coalesce(old.status, '')
+        AND project_id = (
+            SELECT project_id FROM assets WHERE old.entity_type = 'asset' AND id = old.entity_id
+            UNION ALL
+            SELECT project_id FROM shots WHERE old.entity_type = 'shot' AND id = old.entity_id
+        );
+    INSERT INTO status_rollup
+        SELECT project_id, 'task', new.name, coalesce(new.status, ''), 1 FROM assets
+        WHERE new.entity_type = 'asset' AND id = new.entity_id
+        UNION ALL
+        SELECT project_id, 'task', new.name, coalesce(new.status, ''), 1 FROM shots
+        WHERE new.entity_type = 'shot' AND id = new.entity_id
+        ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_delete AFTER DELETE ON tasks BEGIN
+    UPDATE status_rollup SET count = count - 1
+        WHERE entity_type = 'task' AND category = old.name AND status = coalesce(old.status, '')
+        AND project_id = (
+            SELECT project_id FROM assets WHERE old.entity_type = 'asset' AND id = old.entity_id
+            UNION ALL
+            SELECT project_id FROM shots WHERE old.entity_type = 'shot' AND id = old.entity_id
+        );
+END;
+
+-- Append-only log of every row written, in commit order, for incremental
+-- sync: clients remember the last seq they saw and ask for what follows.
+-- AUTOINCREMENT keeps seq values from being reused after a prune.
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity_type TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    op TEXT NOT NULL,
+    project_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_changes_project ON changes(project_id);
+
+CREATE TRIGGER IF NOT EXISTS trg_projects_changes_insert AFTER INSERT ON projects BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('project', new.id, 'insert', new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_projects_changes_update AFTER UPDATE ON projects BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('project', new.id, 'update', new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_projects_changes_delete AFTER DELETE ON projects BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('project', old.id, 'delete', old.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_assets_changes_insert AFTER INSERT ON assets BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('asset', new.id, 'insert', new.project_id);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_changes_update AFTER UPDATE ON assets BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('asset', new.id, 'update', new.project_id);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_changes_delete AFTER DELETE ON assets BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('asset', old.id, 'delete', old.project_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_shots_changes_insert AFTER INSERT ON shots BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('shot', new.id, 'insert', new.project_id);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_changes_update AFTER UPDATE ON shots BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('shot', new.id, 'update', new.project_id);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_changes_delete AFTER DELETE ON shots BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('shot', old.id, 'delete', old.project_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_changes_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('task', new.id, 'insert', (
+        SELECT project_id FROM assets WHERE new.entity_type = 'asset' AND id = new.entity_id
+        UNION ALL
+        SELECT project_id FROM shots WHERE new.entity_type = 'shot' AND id = new.entity_id
+    ));
+END;
+-- Every column but project_id, which the trg_tasks_project_* triggers set
+-- on each insert and would otherwise log as a second change.
+CREATE TRIGGER IF NOT EXISTS trg_tasks_changes_update AFTER UPDATE OF
+    entity_type, entity_id, name, status, assignee, due_date, priority, created_at, metadata
+ON tasks BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('task', new.id, 'update', (
+        SELECT project_id FROM assets WHERE new.entity_type = 'asset' AND id = new.entity_id
+        UNION ALL
+        SELECT project_id FROM shots WHERE new.entity_type = 'shot' AND id = new.entity_id
+    ));
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tasks_changes_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('task', old.id, 'delete', (
+        SELECT project_id FROM assets WHERE old.entity_type = 'asset' AND id = old.entity_id
+        UNION ALL
+        SELECT project_id FROM shots WHERE old.entity_type = 'shot' AND id = old.entity_id
+    ));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_versions_changes_insert AFTER INSERT ON versions BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('version', new.id, 'insert', (
+        SELECT coalesce(a.project_id, s.project_id) FROM tasks t
+        LEFT JOIN assets a ON t.entity_type = 'asset' AND a.id = t.entity_id
+        LEFT JOIN shots s ON t.entity_type = 'shot' AND s.id = t.entity_id
+        WHERE t.id = new.task_id
+    ));
+END;
+CREATE TRIGGER IF NOT EXISTS trg_versions_changes_update AFTER UPDATE ON versions BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('version', new.id, 'update', (
+        SELECT coalesce(a.project_id, s.project_id) FROM tasks t
+        LEFT JOIN assets a ON t.entity_type = 'asset' AND a.id = t.entity_id
+        LEFT JOIN shots s ON t.entity_type = 'shot' AND s.id = t.entity_id
+        WHERE t.id = new.task_id
+    ));
+END;
+CREATE TRIGGER IF NOT EXISTS trg_versions_changes_delete AFTER DELETE ON versions BEGIN
+    INSERT INTO changes (entity_type, entity_id, op, project_id)
+    VALUES ('version', old.id, 'delete', (
+        SELECT coalesce(a.project_id, s.project_id) FROM tasks t
+        LEFT JOIN assets a ON t.entity_type = 'asset' AND a.id = t.entity_id
+        LEFT JOIN shots s ON t.entity_type = 'shot' AND s.id = t.entity_id
+        WHERE t.id = old.task_id
+    ));
+END;
+
+-- Frame ranges of every shot as 1-D integer boxes, so "overlaps frames
+-- a-b" is an R*Tree search instead of a scan over shots.
+CREATE VIRTUAL TABLE IF NOT EXISTS shot_frames USING rtree_i32(id, frame_start, frame_end);
+
+CREATE TRIGGER IF NOT EXISTS trg_shots_frames_insert AFTER INSERT ON shots BEGIN
+    INSERT INTO shot_frames VALUES (new.id, new.frame_start, new.frame_end);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_frames_update
+AFTER UPDATE OF frame_start, frame_end ON shots BEGIN
+    UPDATE shot_frames SET frame_start = new.frame_start, frame_end = new.frame_end
+        WHERE id = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_frames_delete AFTER DELETE ON shots BEGIN
+    DELETE FROM shot_frames WHERE id = old.id;
+END;
+
+-- Full-text index over assets, shots, tasks and versions. The rowid packs
+-- the source row as id * 4 + kind (0 asset, 1 shot, 2 task, 3 version), so
+-- one MATCH ranks every entity type together. `name` holds the entity name
+-- (a version's path) and `body` its description, notes or assignee.
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+    name, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_assets_search_insert AFTER INSERT ON assets BEGIN
+    INSERT INTO search (rowid, name, body) VALUES (new.id * 4, new.name, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_search_update
+AFTER UPDATE OF name, description ON assets BEGIN
+    UPDATE search SET name = new.name, body = new.description WHERE rowid = old.id * 4;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_assets_search_delete AFTER DELETE ON assets BEGIN
+    DELETE FROM search WHERE rowid = old.id * 4;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_shots_search_insert AFTER INSERT ON shots BEGIN
+    INSERT INTO search (rowid, name, body) VALUES (new.id * 4 + 1, new.name, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_search_update
+AFTER UPDATE OF name, description ON shots BEGIN
+    UPDATE search SET name = new.name, body = new.description WHERE rowid = old.id * 4 + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_shots_search_delete AFTER DELETE ON shots BEGIN
+    DELETE FROM search WHERE rowid = old.id * 4 + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_search_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO search (rowid, name, body) VALUES (new.id * 4 + 2, new.name, new.assignee);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tasks_search_update AFTER UPDATE OF name, assignee ON tasks BEGIN
+    UPDATE search SET name = new.name, body = new.assignee WHERE rowid = old.id * 4 + 2;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tasks_search_delete AFTER DELETE ON tasks BEGIN
+    DELETE FROM search WHERE rowid = old.id * 4 + 2;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_versions_search_insert AFTER INSERT ON versions BEGIN
+    INSERT INTO search (rowid, name, body) VALUES (new.id * 4 + 3, new.path, new.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_versions_search_update
+AFTER UPDATE OF path, notes ON versions BEGIN
+    UPDATE search SET name = new.path, body = new.notes WHERE rowid = old.id * 4 + 3;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_versions_search_delete AFTER DELETE ON versions BEGIN
+    DELETE FROM search WHERE rowid = old.id * 4 + 3;
+END;
+"""
+
+# Statements that fill a derived table from existing rows, run once in the
+# transaction where `_SCHEMA` creates that table, whether on a new database
+# or one that predates it. Triggers keep it current from then on.
+_BACKFILL = {
+    "entity_counts": """
+        INSERT INTO entity_counts
+        SELECT 'projects', COUNT(*) FROM projects
+        UNION ALL SELECT 'assets', COUNT(*) FROM assets
+        UNION ALL SELECT 'shots', COUNT(*) FROM shots
+        UNION ALL SELECT 'tasks', COUNT(*) FROM tasks
+        UNION ALL SELECT 'versions', COUNT(*) FROM versions
+    """,
+    "status_rollup": """
+        INSERT INTO status_rollup
+        SELECT project_id, 'asset', asset_type, coalesce(status, ''), COUNT(*)
+        FROM assets GROUP BY 1, 3, 4
+        UNION ALL
+        SELECT project_id, 'shot', sequence, coalesce(status, ''), COUNT(*)
+        FROM shots GROUP BY 1, 3, 4
+        UNION ALL
+        SELECT e.project_id, 'task', t.name, coalesce(t.status, ''), COUNT(*)
+        FROM tasks t JOIN (
+            SELECT 'asset' AS entity_type, id, project_id FROM assets
+            UNION ALL SELECT 'shot', id, project_id FROM shots
+        ) e ON e.entity_type = t.entity_type AND e.id = t.entity_id
+        GROUP BY 1, 3, 4
+    """,
+    "shot_frames": "INSERT INTO shot_frames SELECT id, frame_start, frame_end FROM shots",
+    "search": """
+        INSERT INTO search (rowid, name, body)
+        SELECT id * 4, name, description FROM assets
+        UNION ALL SELECT id * 4 + 1, name, description FROM shots
+        UNION ALL SELECT id * 4 + 2, name, assignee FROM tasks
+        UNION ALL SELECT id * 4 + 3, path, notes FROM versions
+    """,
+}
+
+_BACKFILL_TASK_PROJECT = """
+    UPDATE tasks SET project_id = coalesce(
+        (SELECT project_id FROM assets WHERE tasks.entity_type = 'asset' AND id = tasks.entity_id),
+        (SELECT project_id FROM shots WHERE tasks.entity_type = 'shot' AND id = tasks.entity_id)
+    )
+"""
+
+# Explicit column lists, in model field order, for the positional
+# `_row_to_*` decoders. Timestamps and metadata are handed to the models as
+# raw text and only parsed when first read.
+_PROJECT_COLUMNS = "id, name, code, status, description, created_at, metadata"
+_ASSET_COLUMNS = (
+    "id, project_id, name, asset_type, status, description, thumbnail, created_at, metadata"
+)
+_TASK_COLUMNS = (
+    "id, entity_type, entity_id, name, status, assignee, due_date, priority, created_at, metadata"
+)
+_TASK_COLUMNS_T = ", ".join(f"t.{column}" for column in _TASK_COLUMNS.split(", "))
+_SHOT_COLUMNS = (
+    "id, project_id, sequence, name, frame_start, frame_end, status,"
+    " description, thumbnail, created_at, metadata"
+)
+_VERSION_COLUMNS = (
+    "id, task_id, version_number, status, path, thumbnail, notes, created_by, created_at, metadata"
+)
+
+# Metadata keys are inlined into the SQL (so expression indexes can match),
+# which makes this whitelist the only thing standing between a key and an
+# injection.
+_METADATA_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_ENTITY_TABLES = {
+    "project": "projects",
+    "asset": "assets",
+    "shot": "shots",
+    "task": "tasks",
+    "version": "versions",
+}
+
+# Studio methods that manage instrumentation or the connection itself.
+_NOT_INSTRUMENTED = frozenset({
+    "close", "transaction", "enable_instrumentation", "disable_instrumentation", "explain",
+})
+
+# IDs per IN (...) list when batch-loading relationships; well under
+# SQLITE_MAX_VARIABLE_NUMBER on every SQLite build.
+_IN_CHUNK = 500
 
 
 class Studio:
@@ -20,109 +539,160 @@ class Studio:
         asset = studio.create_asset(project, name="hero", asset_type="character")
     """
     
-    def __init__(self, db_path: Union[str, Path] = ":memory:") -> None:
+    def __init__(
+        self,
+        db_path: Union[str, Path] = ":memory:",
+        cache_size: int = 0,
+    ) -> None:
         """Initialize studio database.
         
+        File databases are opened in WAL mode with one read connection per
+        thread and a dedicated writer connection, so queries from many
+        threads run concurrently with a write in progress.
+        
         Args:
             db_path: Path to SQLite database, or ":memory:" for in-memory
+            cache_size: Number of entities to keep in an LRU identity map
+                for the `get_*` lookups; 0 disables it.
+                Only writes made through this Studio keep it up to date.
         """
         self.db_path = Path(db_path) if db_path != ":memory:" else db_path
-        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
+        self._pool = ConnectionPool(str(db_path))
+        self._cache = EntityCache(cache_size) if cache_size else None
+        if self._cache is not None:
+            self._pool.rollback_hooks.append(self._cache.clear)
+        # Project codes never change once created, so resolved IDs are kept
+        # for the life of the Studio.
+        self._project_ids: dict[str, int] = {}
+        self._pool.rollback_hooks.append(self._project_ids.clear)
+        self.instrumentation: Optional[Instrumentation] = None
         self._init_schema()
     
     def _init_schema(self) -> None:
         """Create database tables if they don't exist."""
-        cursor = self._conn.cursor()
-        
-        cursor.executescript("""
-            CREATE TABLE IF NOT EXISTS projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                code TEXT UNIQUE NOT NULL,
-                status TEXT DEFAULT 'active',
-                description TEXT,
-                created_at TEXT,
-                metadata TEXT DEFAULT '{}'
-            );
-            
-            CREATE TABLE IF NOT EXISTS assets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                asset_type TEXT NOT NULL,
-                status TEXT DEFAULT 'waiting',
-                description TEXT,
-                thumbnail TEXT,
-                created_at TEXT,
-                metadata TEXT DEFAULT '{}',
-                FOREIGN KEY (project_id) REFERENCES projects(id),
-                UNIQUE (project_id, name)
-            );
-            
-            CREATE TABLE IF NOT EXISTS shots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER NOT NULL,
-                sequence TEXT NOT NULL,
-                name TEXT NOT NULL,
-                frame_start INTEGER DEFAULT 1001,
-                frame_end INTEGER DEFAULT 1100,
-                status TEXT DEFAULT 'waiting',
-                description TEXT,
-                thumbnail TEXT,
-                created_at TEXT,
-                metadata TEXT DEFAULT '{}',
-                FOREIGN KEY (project_id) REFERENCES projects(id),
-                UNIQUE (project_id, name)
-            );
-            
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                entity_type TEXT NOT NULL,
-                entity_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                status TEXT DEFAULT 'waiting',
-                assignee TEXT,
-                due_date TEXT,
-                priority INTEGER DEFAULT 50,
-                created_at TEXT,
-                metadata TEXT DEFAULT '{}',
-                UNIQUE (entity_type, entity_id, name)
-            );
-            
-            CREATE TABLE IF NOT EXISTS versions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task_id INTEGER NOT NULL,
-                version_number INTEGER NOT NULL,
-                status TEXT DEFAULT 'pending_review',
-                path TEXT,
-                thumbnail TEXT,
-                notes TEXT,
-                created_by TEXT,
-                created_at TEXT,
-                metadata TEXT DEFAULT '{}',
-                FOREIGN KEY (task_id) REFERENCES tasks(id),
-                UNIQUE (task_id, version_number)
-            );
-            
-            CREATE INDEX IF NOT EXISTS idx_assets_project ON assets(project_id);
-            CREATE INDEX IF NOT EXISTS idx_shots_project ON shots(project_id);
-            CREATE INDEX IF NOT EXISTS idx_tasks_entity ON tasks(entity_type, entity_id);
-            CREATE INDEX IF NOT EXISTS idx_versions_task ON versions(task_id);
-        """)
+        with self._pool.write() as conn:
+            self._create_tables(conn)
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        existing = {
+            name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        task_columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+        add_task_project = "tasks" in existing and "project_id" not in task_columns
+        if add_task_project:
+            # Databases from before tasks stored their project. The old change
+            # trigger fires on any column and is recreated by _SCHEMA.
+            conn.execute("ALTER TABLE tasks ADD COLUMN project_id INTEGER")
+            conn.execute("DROP TRIGGER IF EXISTS trg_tasks_changes_update")
+        # executescript() would commit the surrounding transaction, so the
+        # schema is applied one complete statement at a time.
+        statement = ""
+        for line in _SCHEMA.splitlines(keepends=True):
+            statement += line
+            if sqlite3.complete_statement(statement):
+                conn.execute(statement)
+                statement = ""
+        for table, backfill in _BACKFILL.items():
+            if table not in existing:
+                conn.execute(backfill)
+        if add_task_project:
+            conn.execute(_BACKFILL_TASK_PROJECT)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[Studio]:
+        """Group several writes into one atomic transaction.
+        
+        Writes made inside the block are committed together when it exits
+        and rolled back if it raises. Blocks may be nested; inner blocks
+        become savepoints that roll back on their own.
         
-        self._conn.commit()
+        Example:
+            with studio.transaction():
+                asset = studio.create_asset(project, name="hero", asset_type="character")
+                model = studio.create_task(asset, name="model")
+                studio.create_version(model, path="/path/to/hero_model_v001.usd")
+        """
+        with self._pool.write():
+            yield self
     
     def close(self) -> None:
-        """Close database connection."""
-        self._conn.close()
+        """Close all database connections."""
+        self._pool.close()
+    
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Identity map statistics, or None if caching is disabled."""
+        return self._cache.info() if self._cache is not None else None
+    
+    def enable_instrumentation(
+        self,
+        capacity: int = 1000,
+        slow_ms: Optional[float] = None,
+    ) -> Instrumentation:
+        """Start timing every public method call and capturing its SQL.
+        
+        Records land in `self.instrumentation.records`, a ring buffer of the
+        last `capacity` calls. Calls taking at least `slow_ms` milliseconds
+        are logged as warnings on the "opengrid" logger, including calls
+        that raise. `iter_*` calls are recorded when the iterator finishes,
+        covering every item it produced.
+        """
+        self.disable_instrumentation()
+        instrumentation = Instrumentation(capacity, slow_ms)
+        for name in dir(type(self)):
+            if name.startswith("_") or name in _NOT_INSTRUMENTED:
+                continue
+            method = getattr(self, name)
+            if callable(method):
+                # Instance attributes shadow the class methods, so the
+                # disabled path has no wrapper overhead at all.
+                setattr(self, name, instrumentation.wrap(name, method))
+        self._pool.set_trace_callback(instrumentation.trace)
+        self.instrumentation = instrumentation
+        return instrumentation
+    
+    def disable_instrumentation(self) -> None:
+        """Stop timing calls; recorded data stays on the returned object."""
+        if self.instrumentation is None:
+            return
+        self._pool.set_trace_callback(None)
+        for name in list(vars(self)):
+            if callable(vars(self)[name]) and not name.startswith("_"):
+                delattr(self, name)
+        self.instrumentation = None
+    
+    def explain(self, query: str, params: Iterable[Any] = ()) -> list[str]:
+        """Return SQLite's EXPLAIN QUERY PLAN steps for a query."""
+        with self._pool.read() as conn:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {query}", tuple(params)).fetchall()
+        return [row[3] for row in rows]
+    
+    def index_metadata(self, entity_type: str, key: str) -> None:
+        """Index a top-level metadata key used in `metadata=` filters.
+        
+        Creates an index on the same `json_extract` expression the `find_*`
+        and `count_*` filters compile to, so equality lookups on the key
+        stop scanning the table. Safe to call on every start-up.
+        
+        Args:
+            entity_type: "project", "asset", "shot", "task" or "version"
+            key: Metadata key, e.g. "department"
+        """
+        table = _ENTITY_TABLES.get(entity_type)
+        if table is None:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+        self._check_metadata_key(key)
+        with self._pool.write() as conn:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_meta_{key} "
+                f"ON {table}(json_extract(metadata, '$.{key}'))"
+            )
     
     def __enter__(self) -> Studio:
         return self
     
     def __exit__(self, *args) -> None:
         self.close()
-    
+
     # =========================================================================
     # Projects
     # =========================================================================
@@ -139,15 +709,14 @@ class Studio:
         now = datetime.now().isoformat()
         metadata_json = json.dumps(metadata or {})
         
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """INSERT INTO projects (name, code, status, description, created_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (name, code, status, description, now, metadata_json),
-        )
-        self._conn.commit()
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                """INSERT INTO projects (name, code, status, description, created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (name, code, status, description, now, metadata_json),
+            )
         
-        return Project(
+        project = Project(
             id=cursor.lastrowid,
             name=name,
             code=code,
@@ -156,32 +725,79 @@ class Studio:
             created_at=datetime.fromisoformat(now),
             metadata=metadata or {},
         )
+        self._remember_project_id(code, project.id)
+        self._remember(("project", code), project)
+        return project
     
     def get_project(self, code: str) -> Optional[Project]:
         """Get a project by code."""
-        cursor = self._conn.cursor()
-        cursor.execute("SELECT * FROM projects WHERE code = ?", (code,))
-        row = cursor.fetchone()
-        return self._row_to_project(row) if row else None
-    
-    def find_projects(self, status: Optional[str] = None) -> list[Project]:
-        """Find projects, optionally filtered by status."""
-        cursor = self._conn.cursor()
+        project, epoch = self._cached(("project", code))
+        if project is not None:
+            return project
+        with self._pool.read() as conn:
+            row = conn.execute(
+                f"SELECT {_PROJECT_COLUMNS} FROM projects WHERE code = ?", (code,)
+            ).fetchone()
+        if not row:
+            return None
+        project = self._row_to_project(row)
+        self._remember(("project", code), project, epoch)
+        return project
+    
+    def find_projects(
+        self,
+        status: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> list[Project]:
+        """Find projects, optionally filtered by status and metadata.
+        
+        Results are ordered by ID. Pass `limit` for one page at a time and
+        the last ID seen as `after` to fetch the next page.
+        """
+        query = f"SELECT {_PROJECT_COLUMNS} FROM projects WHERE 1=1"
+        params: list[Any] = []
+        
         if status:
-            cursor.execute("SELECT * FROM projects WHERE status = ?", (status,))
-        else:
-            cursor.execute("SELECT * FROM projects")
-        return [self._row_to_project(row) for row in cursor.fetchall()]
+            query += " AND status = ?"
+            params.append(status)
+        if metadata:
+            query += self._metadata_filter(metadata, params)
+        
+        query = self._paginate(query, params, limit, after)
+        with self._pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return list(map(self._row_to_project, rows))
+    
+    def count_projects(
+        self,
+        status: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Count projects, optionally filtered by status and metadata."""
+        if not (status or metadata):
+            return self._total("projects")
+        query = "SELECT COUNT(*) FROM projects WHERE 1=1"
+        params: list[Any] = []
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        if metadata:
+            query += self._metadata_filter(metadata, params)
+        return self._count(query, params)
     
-    def _row_to_project(self, row: sqlite3.Row) -> Project:
+    @staticmethod
+    def _row_to_project(row: tuple) -> Project:
+        id, name, code, status, description, created_at, metadata = row
         return Project(
-            id=row["id"],
-            name=row["name"],
-            code=row["code"],
-            status=row["status"],
-            description=row["description"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            id,
+            name,
+            code,
+            status,
+            description,
+            created_at or datetime.now(),
+            metadata or "{}",
         )
     
     # =========================================================================
@@ -202,15 +818,15 @@ class Studio:
         now = datetime.now().isoformat()
         metadata_json = json.dumps(metadata or {})
         
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """INSERT INTO assets (project_id, name, asset_type, status, description, created_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (project_id, name, asset_type, status, description, now, metadata_json),
-        )
-        self._conn.commit()
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                """INSERT INTO assets
+                       (project_id, name, asset_type, status, description, created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (project_id, name, asset_type, status, description, now, metadata_json),
+            )
         
-        return Asset(
+        asset = Asset(
             id=cursor.lastrowid,
             project_id=project_id,
             name=name,
@@ -220,27 +836,141 @@ class Studio:
             created_at=datetime.fromisoformat(now),
             metadata=metadata or {},
         )
+        self._remember(("asset", project_id, name), asset)
+        return asset
+    
+    def create_assets_bulk(
+        self,
+        project: Union[Project, int, str],
+        assets: Iterable[dict[str, Any]],
+    ) -> list[Asset]:
+        """Create many assets in a single transaction.
+        
+        Args:
+            project: Project the assets belong to
+            assets: Mappings with the keyword arguments of `create_asset`
+                (name, asset_type, and optionally status, description, metadata)
+        """
+        project_id = self._resolve_project_id(project)
+        now = datetime.now().isoformat()
+        created = [
+            Asset(
+                id=0,
+                project_id=project_id,
+                name=a["name"],
+                asset_type=a["asset_type"],
+                status=a.get("status", "waiting"),
+                description=a.get("description"),
+                created_at=datetime.fromisoformat(now),
+                metadata=a.get("metadata") or {},
+            )
+            for a in assets
+        ]
+        rows = [
+            (
+                a.project_id, a.name, a.asset_type, a.status, a.description,
+                now, json.dumps(a.metadata),
+            )
+            for a in created
+        ]
+        
+        with self._pool.write() as conn:
+            ids = self._insert_many(
+                conn,
+                """INSERT INTO assets
+                       (project_id, name, asset_type, status, description, created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+        
+        for asset, asset_id in zip(created, ids):
+            asset.id = asset_id
+        return created
     
     def get_asset(self, project: Union[Project, int, str], name: str) -> Optional[Asset]:
         """Get an asset by project and name."""
         project_id = self._resolve_project_id(project)
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT * FROM assets WHERE project_id = ? AND name = ?",
-            (project_id, name),
-        )
-        row = cursor.fetchone()
-        return self._row_to_asset(row) if row else None
+        asset, epoch = self._cached(("asset", project_id, name))
+        if asset is not None:
+            return asset
+        with self._pool.read() as conn:
+            row = conn.execute(
+                f"SELECT {_ASSET_COLUMNS} FROM assets WHERE project_id = ? AND name = ?",
+                (project_id, name),
+            ).fetchone()
+        if not row:
+            return None
+        asset = self._row_to_asset(row)
+        self._remember(("asset", project_id, name), asset, epoch)
+        return asset
     
     def find_assets(
         self,
         project: Optional[Union[Project, int, str]] = None,
         asset_type: Optional[str] = None,
         status: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        include: Collection[str] = (),
     ) -> list[Asset]:
-        """Find assets with optional filters."""
-        query = "SELECT * FROM assets WHERE 1=1"
-        params = []
+        """Find assets with optional filters.
+        
+        `metadata` filters on top-level metadata keys by equality, inside
+        SQLite; see `index_metadata` for keys queried often.
+        
+        Results are ordered by ID. Pass `limit` for one page at a time and
+        the last ID seen as `after` to fetch the next page.
+        
+        `include` eagerly loads relationships with one batched query per
+        level: "tasks" fills `Asset.tasks`, "tasks.versions" also fills
+        `Task.versions`. Back-references (`Task.entity`, `Version.task`)
+        are set on the loaded children.
+        """
+        self._check_include(include, ("tasks", "tasks.versions"))
+        query, params = self._asset_query(project, asset_type, status, metadata)
+        query = self._paginate(query, params, limit, after)
+        with self._pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        assets = list(map(self._row_to_asset, rows))
+        if include:
+            self._load_tasks(assets, "asset", "tasks.versions" in include)
+        return assets
+    
+    def iter_assets(
+        self,
+        project: Optional[Union[Project, int, str]] = None,
+        asset_type: Optional[str] = None,
+        status: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Asset]:
+        """Iterate over assets in ID order, fetching `chunk_size` rows at a time."""
+        query, params = self._asset_query(project, asset_type, status, metadata)
+        return self._iterate(query + " ORDER BY id", params, self._row_to_asset, chunk_size)
+    
+    def count_assets(
+        self,
+        project: Optional[Union[Project, int, str]] = None,
+        asset_type: Optional[str] = None,
+        status: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Count assets matching the same filters as `find_assets`."""
+        if not (project or asset_type or status or metadata):
+            return self._total("assets")
+        return self._count(*self._asset_query(project, asset_type, status, metadata, "COUNT(*)"))
+    
+    def _asset_query(
+        self,
+        project: Optional[Union[Project, int, str]],
+        asset_type: Optional[str],
+        status: Optional[str],
+        metadata: Optional[dict[str, Any]],
+        columns: str = _ASSET_COLUMNS,
+    ) -> tuple[str, list[Any]]:
+        query = f"SELECT {columns} FROM assets WHERE 1=1"
+        params: list[Any] = []
         
         if project:
             query += " AND project_id = ?"
@@ -251,22 +981,325 @@ class Studio:
         if status:
             query += " AND status = ?"
             params.append(status)
-        
-        cursor = self._conn.cursor()
-        cursor.execute(query, params)
-        return [self._row_to_asset(row) for row in cursor.fetchall()]
+        if metadata:
+            query += self._metadata_filter(metadata, params)
+        return query, params
     
-    def _row_to_asset(self, row: sqlite3.Row) -> Asset:
+    @staticmethod
+    def _row_to_asset(row: tuple) -> Asset:
+        id, project_id, name, asset_type, status, description, thumbnail, created_at, metadata = row
         return Asset(
-            id=row["id"],
-            project_id=row["project_id"],
-            name=row["name"],
-            asset_type=row["asset_type"],
-            status=row["status"],
-            description=row["description"],
-            thumbnail=row["thumbnail"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            id,
+            project_id,
+            name,
+            asset_type,
+            status,
+            description,
+            thumbnail,
+            created_at or datetime.now(),
+            metadata or "{}",
+        )
+    
+    # =========================================================================
+    # Shots
+    # =========================================================================
+    
+    def create_shot(
+        self,
+        project: Union[Project, int, str],
+        sequence: str,
+        name: str,
+        frame_start: int = 1001,
+        frame_end: int = 1100,
+        status: str = "waiting",
+        description: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ) -> Shot:
+        """Create a new shot."""
+        self._check_frames(frame_start, frame_end)
+        project_id = self._resolve_project_id(project)
+        now = datetime.now().isoformat()
+        metadata_json = json.dumps(metadata or {})
+        
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                """INSERT INTO shots
+                       (project_id, sequence, name, frame_start, frame_end, status, description,
+                        created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    project_id, sequence, name, frame_start, frame_end,
+                    status, description, now, metadata_json,
+                ),
+            )
+        
+        shot = Shot(
+            id=cursor.lastrowid,
+            project_id=project_id,
+            sequence=sequence,
+            name=name,
+            frame_start=frame_start,
+            frame_end=frame_end,
+            status=status,
+            description=description,
+            created_at=datetime.fromisoformat(now),
+            metadata=metadata or {},
+        )
+        self._remember(("shot", project_id, name), shot)
+        return shot
+    
+    def create_shots_bulk(
+        self,
+        project: Union[Project, int, str],
+        shots: Iterable[dict[str, Any]],
+    ) -> list[Shot]:
+        """Create many shots in a single transaction.
+        
+        Args:
+            project: Project the shots belong to
+            shots: Mappings with sequence, name, and optionally frame_start,
+                frame_end, status, description, metadata
+        """
+        project_id = self._resolve_project_id(project)
+        now = datetime.now().isoformat()
+        created = [
+            Shot(
+                id=0,
+                project_id=project_id,
+                sequence=s["sequence"],
+                name=s["name"],
+                frame_start=s.get("frame_start", 1001),
+                frame_end=s.get("frame_end", 1100),
+                status=s.get("status", "waiting"),
+                description=s.get("description"),
+                created_at=datetime.fromisoformat(now),
+                metadata=s.get("metadata") or {},
+            )
+            for s in shots
+        ]
+        for shot in created:
+            self._check_frames(shot.frame_start, shot.frame_end)
+        rows = [
+            (
+                s.project_id, s.sequence, s.name, s.frame_start, s.frame_end,
+                s.status, s.description, now, json.dumps(s.metadata),
+            )
+            for s in created
+        ]
+        
+        with self._pool.write() as conn:
+            ids = self._insert_many(
+                conn,
+                """INSERT INTO shots
+                       (project_id, sequence, name, frame_start, frame_end, status, description,
+                        created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+        
+        for shot, shot_id in zip(created, ids):
+            shot.id = shot_id
+        return created
+    
+    def get_shot(self, project: Union[Project, int, str], name: str) -> Optional[Shot]:
+        """Get a shot by project and name."""
+        project_id = self._resolve_project_id(project)
+        shot, epoch = self._cached(("shot", project_id, name))
+        if shot is not None:
+            return shot
+        with self._pool.read() as conn:
+            row = conn.execute(
+                f"SELECT {_SHOT_COLUMNS} FROM shots WHERE project_id = ? AND name = ?",
+                (project_id, name),
+            ).fetchone()
+        if not row:
+            return None
+        shot = self._row_to_shot(row)
+        self._remember(("shot", project_id, name), shot, epoch)
+        return shot
+    
+    def update_shot(
+        self,
+        shot: Union[Shot, int],
+        status: Optional[str] = None,
+        frame_start: Optional[int] = None,
+        frame_end: Optional[int] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Shot]:
+        """Update shot fields.
+        
+        Returns the updated shot as stored, or None if no shot has that ID.
+        """
+        shot_id = shot.id if isinstance(shot, Shot) else shot
+        
+        updates = []
+        params: list[Any] = []
+        
+        if status is not None:
+            updates.append("status = ?")
+            params.append(status)
+        if frame_start is not None:
+            updates.append("frame_start = ?")
+            params.append(frame_start)
+        if frame_end is not None:
+            updates.append("frame_end = ?")
+            params.append(frame_end)
+        if description is not None:
+            updates.append("description = ?")
+            params.append(description)
+        
+        if not updates:
+            with self._pool.read() as conn:
+                row = conn.execute(
+                    f"SELECT {_SHOT_COLUMNS} FROM shots WHERE id = ?", (shot_id,)
+                ).fetchone()
+            return self._row_to_shot(row) if row else None
+        
+        params.append(shot_id)
+        with self._pool.write() as conn:
+            if (frame_start is None) != (frame_end is None):
+                # Validate a half-given range against the stored other end
+                # inside the same transaction.
+                current = conn.execute(
+                    "SELECT frame_start, frame_end FROM shots WHERE id = ?", (shot_id,)
+                ).fetchone()
+                if current:
+                    self._check_frames(
+                        current[0] if frame_start is None else frame_start,
+                        current[1] if frame_end is None else frame_end,
+                    )
+            elif frame_start is not None:
+                self._check_frames(frame_start, frame_end)
+            row = conn.execute(
+                f"UPDATE shots SET {', '.join(updates)} WHERE id = ? RETURNING {_SHOT_COLUMNS}",
+                params,
+            ).fetchone()
+        if not row:
+            return None
+        updated = self._row_to_shot(row)
+        self._remember(("shot", updated.project_id, updated.name), updated)
+        return updated
+    
+    def find_shots(
+        self,
+        project: Optional[Union[Project, int, str]] = None,
+        sequence: Optional[str] = None,
+        status: Optional[str] = None,
+        overlapping: Optional[tuple[int, int]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        include: Collection[str] = (),
+    ) -> list[Shot]:
+        """Find shots with optional filters.
+        
+        `overlapping=(first, last)` keeps shots whose frame range shares at
+        least one frame with `first`-`last` (inclusive), looked up in the
+        frame-range R*Tree. `metadata` filters on top-level metadata keys
+        by equality, inside SQLite.
+        
+        Results are ordered by ID. Pass `limit` for one page at a time and
+        the last ID seen as `after` to fetch the next page.
+        
+        `include` eagerly loads "tasks" or "tasks.versions" as in
+        `find_assets`.
+        
+        Example:
+            studio.find_shots("MYFILM", sequence="SQ010", overlapping=(1040, 1200))
+        """
+        self._check_include(include, ("tasks", "tasks.versions"))
+        query, params = self._shot_query(project, sequence, status, overlapping, metadata)
+        query = self._paginate(query, params, limit, after)
+        with self._pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        shots = list(map(self._row_to_shot, rows))
+        if include:
+            self._load_tasks(shots, "shot", "tasks.versions" in include)
+        return shots
+    
+    def iter_shots(
+        self,
+        project: Optional[Union[Project, int, str]] = None,
+        sequence: Optional[str] = None,
+        status: Optional[str] = None,
+        overlapping: Optional[tuple[int, int]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Shot]:
+        """Iterate over shots in ID order, fetching `chunk_size` rows at a time."""
+        query, params = self._shot_query(project, sequence, status, overlapping, metadata)
+        return self._iterate(query + " ORDER BY id", params, self._row_to_shot, chunk_size)
+    
+    def count_shots(
+        self,
+        project: Optional[Union[Project, int, str]] = None,
+        sequence: Optional[str] = None,
+        status: Optional[str] = None,
+        overlapping: Optional[tuple[int, int]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Count shots matching the same filters as `find_shots`."""
+        if not (project or sequence or status or overlapping or metadata):
+            return self._total("shots")
+        return self._count(
+            *self._shot_query(project, sequence, status, overlapping, metadata, "COUNT(*)")
+        )
+    
+    def _shot_query(
+        self,
+        project: Optional[Union[Project, int, str]],
+        sequence: Optional[str],
+        status: Optional[str],
+        overlapping: Optional[tuple[int, int]],
+        metadata: Optional[dict[str, Any]],
+        columns: str = _SHOT_COLUMNS,
+    ) -> tuple[str, list[Any]]:
+        query = f"SELECT {columns} FROM shots WHERE 1=1"
+        params: list[Any] = []
+        
+        if project:
+            query += " AND project_id = ?"
+            params.append(self._resolve_project_id(project))
+        if sequence:
+            query += " AND sequence = ?"
+            params.append(sequence)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        if overlapping:
+            first, last = overlapping
+            query += (
+                " AND id IN (SELECT id FROM shot_frames"
+                " WHERE frame_start <= ? AND frame_end >= ?)"
+            )
+            params.extend([last, first])
+        if metadata:
+            query += self._metadata_filter(metadata, params)
+        return query, params
+    
+    @staticmethod
+    def _check_frames(frame_start: int, frame_end: int) -> None:
+        if frame_end < frame_start:
+            raise ValueError(f"frame_end {frame_end} is before frame_start {frame_start}")
+    
+    @staticmethod
+    def _row_to_shot(row: tuple) -> Shot:
+        (
+            id, project_id, sequence, name, frame_start, frame_end, status,
+            description, thumbnail, created_at, metadata,
+        ) = row
+        return Shot(
+            id,
+            project_id,
+            sequence,
+            name,
+            frame_start,
+            frame_end,
+            status,
+            description,
+            thumbnail,
+            created_at or datetime.now(),
+            metadata or "{}",
         )
     
     # =========================================================================
@@ -289,13 +1322,17 @@ class Studio:
         due_str = due_date.isoformat() if due_date else None
         metadata_json = json.dumps(metadata or {})
         
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """INSERT INTO tasks (entity_type, entity_id, name, status, assignee, due_date, priority, created_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (entity_type, entity.id, name, status, assignee, due_str, priority, now, metadata_json),
-        )
-        self._conn.commit()
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                """INSERT INTO tasks
+                       (entity_type, entity_id, name, status, assignee, due_date, priority,
+                        created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    entity_type, entity.id, name, status, assignee,
+                    due_str, priority, now, metadata_json,
+                ),
+            )
         
         return Task(
             id=cursor.lastrowid,
@@ -310,6 +1347,53 @@ class Studio:
             metadata=metadata or {},
         )
     
+    def create_tasks_bulk(self, tasks: Iterable[dict[str, Any]]) -> list[Task]:
+        """Create many tasks in a single transaction.
+        
+        Args:
+            tasks: Mappings with the keyword arguments of `create_task`
+                (entity, name, and optionally status, assignee, due_date,
+                priority, metadata)
+        """
+        now = datetime.now().isoformat()
+        created = [
+            Task(
+                id=0,
+                entity_type="asset" if isinstance(t["entity"], Asset) else "shot",
+                entity_id=t["entity"].id,
+                name=t["name"],
+                status=t.get("status", "waiting"),
+                assignee=t.get("assignee"),
+                due_date=t.get("due_date"),
+                priority=t.get("priority", 50),
+                created_at=datetime.fromisoformat(now),
+                metadata=t.get("metadata") or {},
+            )
+            for t in tasks
+        ]
+        rows = [
+            (
+                t.entity_type, t.entity_id, t.name, t.status, t.assignee,
+                t.due_date.isoformat() if t.due_date else None,
+                t.priority, now, json.dumps(t.metadata),
+            )
+            for t in created
+        ]
+        
+        with self._pool.write() as conn:
+            ids = self._insert_many(
+                conn,
+                """INSERT INTO tasks
+                       (entity_type, entity_id, name, status, assignee, due_date, priority,
+                        created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+        
+        for task, task_id in zip(created, ids):
+            task.id = task_id
+        return created
+    
     def update_task(
         self,
         task: Union[Task, int],
@@ -317,8 +1401,11 @@ class Studio:
         assignee: Optional[str] = None,
         due_date: Optional[datetime] = None,
         priority: Optional[int] = None,
-    ) -> None:
-        """Update task fields."""
+    ) -> Optional[Task]:
+        """Update task fields.
+        
+        Returns the updated task as stored, or None if no task has that ID.
+        """
         task_id = task.id if isinstance(task, Task) else task
         
         updates = []
@@ -337,24 +1424,145 @@ class Studio:
             updates.append("priority = ?")
             params.append(priority)
         
-        if updates:
-            params.append(task_id)
-            cursor = self._conn.cursor()
-            cursor.execute(
-                f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?",
+        if not updates:
+            return self.get_task(task_id)
+        
+        params.append(task_id)
+        with self._pool.write() as conn:
+            row = conn.execute(
+                f"UPDATE tasks SET {', '.join(updates)} WHERE id = ? RETURNING {_TASK_COLUMNS}",
                 params,
-            )
-            self._conn.commit()
+            ).fetchone()
+        if not row:
+            return None
+        updated = self._row_to_task(row)
+        self._remember(("task", task_id), updated)
+        return updated
+    
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Get a task by ID."""
+        task, epoch = self._cached(("task", task_id))
+        if task is not None:
+            return task
+        with self._pool.read() as conn:
+            row = conn.execute(
+                f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        if not row:
+            return None
+        task = self._row_to_task(row)
+        self._remember(("task", task_id), task, epoch)
+        return task
     
     def find_tasks(
         self,
         entity: Optional[Union[Asset, Shot]] = None,
         status: Optional[str] = None,
         assignee: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        include: Collection[str] = (),
     ) -> list[Task]:
-        """Find tasks with optional filters."""
-        query = "SELECT * FROM tasks WHERE 1=1"
-        params = []
+        """Find tasks with optional filters.
+        
+        `metadata` filters on top-level metadata keys by equality, inside
+        SQLite; see `index_metadata` for keys queried often.
+        
+        Results are ordered by ID. Pass `limit` for one page at a time and
+        the last ID seen as `after` to fetch the next page.
+        
+        `include=["versions"]` fills `Task.versions` (and `Version.task`)
+        with one batched query.
+        """
+        self._check_include(include, ("versions",))
+        query, params = self._task_query(entity, status, assignee, metadata)
+        query = self._paginate(query, params, limit, after)
+        with self._pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        tasks = list(map(self._row_to_task, rows))
+        if include:
+            self._load_versions(tasks)
+        return tasks
+    
+    def iter_tasks(
+        self,
+        entity: Optional[Union[Asset, Shot]] = None,
+        status: Optional[str] = None,
+        assignee: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Task]:
+        """Iterate over tasks in ID order, fetching `chunk_size` rows at a time."""
+        query, params = self._task_query(entity, status, assignee, metadata)
+        return self._iterate(query + " ORDER BY id", params, self._row_to_task, chunk_size)
+    
+    def find_project_tasks(
+        self,
+        project: Union[Project, int, str],
+        status: Optional[str] = None,
+        assignee: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> list[tuple[str, Task]]:
+        """Find tasks on every asset and shot in a project with one query.
+        
+        Returns (entity name, task) pairs ordered by task ID; `limit` and
+        `after` page through them like `find_tasks`.
+        """
+        project_id = self._resolve_project_id(project)
+        # Unary + keeps status/assignee off their own indexes, so a page is
+        # always a range of idx_tasks_project read in ID order, never a sort
+        # over every matching task in the studio.
+        query = f"""
+            SELECT {_TASK_COLUMNS_T}, coalesce(a.name, s.name) FROM tasks t
+            LEFT JOIN assets a ON t.entity_type = 'asset' AND a.id = t.entity_id
+            LEFT JOIN shots s ON t.entity_type = 'shot' AND s.id = t.entity_id
+            WHERE t.project_id = ?"""
+        params: list[Any] = [project_id]
+        if status:
+            query += " AND +t.status = ?"
+            params.append(status)
+        if assignee:
+            query += " AND +t.assignee = ?"
+            params.append(assignee)
+        if metadata:
+            query += self._metadata_filter(metadata, params, "t.metadata")
+        if after is not None:
+            query += " AND t.id > ?"
+            params.append(after)
+        query += " ORDER BY t.id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [(row[-1], self._row_to_task(row[:-1])) for row in rows]
+    
+    def count_tasks(
+        self,
+        entity: Optional[Union[Asset, Shot]] = None,
+        status: Optional[str] = None,
+        assignee: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Count tasks matching the same filters as `find_tasks`."""
+        if not (entity or status or assignee or metadata):
+            return self._total("tasks")
+        return self._count(*self._task_query(entity, status, assignee, metadata, "COUNT(*)"))
+    
+    def _task_query(
+        self,
+        entity: Optional[Union[Asset, Shot]],
+        status: Optional[str],
+        assignee: Optional[str],
+        metadata: Optional[dict[str, Any]],
+        columns: str = _TASK_COLUMNS,
+    ) -> tuple[str, list[Any]]:
+        query = f"SELECT {columns} FROM tasks WHERE 1=1"
+        params: list[Any] = []
         
         if entity:
             entity_type = "asset" if isinstance(entity, Asset) else "shot"
@@ -366,23 +1574,27 @@ class Studio:
         if assignee:
             query += " AND assignee = ?"
             params.append(assignee)
-        
-        cursor = self._conn.cursor()
-        cursor.execute(query, params)
-        return [self._row_to_task(row) for row in cursor.fetchall()]
+        if metadata:
+            query += self._metadata_filter(metadata, params)
+        return query, params
     
-    def _row_to_task(self, row: sqlite3.Row) -> Task:
+    @staticmethod
+    def _row_to_task(row: tuple) -> Task:
+        (
+            id, entity_type, entity_id, name, status, assignee,
+            due_date, priority, created_at, metadata,
+        ) = row
         return Task(
-            id=row["id"],
-            entity_type=row["entity_type"],
-            entity_id=row["entity_id"],
-            name=row["name"],
-            status=row["status"],
-            assignee=row["assignee"],
-            due_date=datetime.fromisoformat(row["due_date"]) if row["due_date"] else None,
-            priority=row["priority"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            id,
+            entity_type,
+            entity_id,
+            name,
+            status,
+            assignee,
+            due_date,
+            priority,
+            created_at or datetime.now(),
+            metadata or "{}",
         )
     
     # =========================================================================
@@ -397,30 +1609,29 @@ class Studio:
         created_by: Optional[str] = None,
         metadata: Optional[dict] = None,
     ) -> Version:
-        """Create a new version for a task."""
-        task_id = task.id if isinstance(task, Task) else task
+        """Create a new version for a task.
         
-        # Get next version number
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT MAX(version_number) FROM versions WHERE task_id = ?",
-            (task_id,),
-        )
-        max_version = cursor.fetchone()[0]
-        version_number = (max_version or 0) + 1
+        The version number is allocated by the INSERT itself, inside the
+        IMMEDIATE write transaction, so concurrent publishes to the same task
+        from several processes each get the next number instead of colliding.
+        """
+        task_id = task.id if isinstance(task, Task) else task
         
         now = datetime.now().isoformat()
         metadata_json = json.dumps(metadata or {})
         
-        cursor.execute(
-            """INSERT INTO versions (task_id, version_number, path, notes, created_by, created_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (task_id, version_number, path, notes, created_by, now, metadata_json),
-        )
-        self._conn.commit()
+        with self._pool.write() as conn:
+            version_id, version_number = conn.execute(
+                """INSERT INTO versions
+                       (task_id, version_number, path, notes, created_by, created_at, metadata)
+                   SELECT ?, COALESCE(MAX(version_number), 0) + 1, ?, ?, ?, ?, ?
+                   FROM versions WHERE task_id = ?
+                   RETURNING id, version_number""",
+                (task_id, path, notes, created_by, now, metadata_json, task_id),
+            ).fetchone()
         
         return Version(
-            id=cursor.lastrowid,
+            id=version_id,
             task_id=task_id,
             version_number=version_number,
             path=path,
@@ -430,6 +1641,293 @@ class Studio:
             metadata=metadata or {},
         )
     
+    def create_versions_bulk(self, versions: Iterable[dict[str, Any]]) -> list[Version]:
+        """Create many versions in a single transaction.
+        
+        Version numbers continue from the latest version of each task, in
+        the order the versions are given.
+        
+        Args:
+            versions: Mappings with the keyword arguments of `create_version`
+                (task, and optionally path, notes, created_by, metadata)
+        """
+        now = datetime.now().isoformat()
+        created = [
+            Version(
+                id=0,
+                task_id=v["task"].id if isinstance(v["task"], Task) else v["task"],
+                version_number=0,
+                path=v.get("path"),
+                notes=v.get("notes"),
+                created_by=v.get("created_by"),
+                created_at=datetime.fromisoformat(now),
+                metadata=v.get("metadata") or {},
+            )
+            for v in versions
+        ]
+        if not created:
+            return created
+        
+        with self._pool.write() as conn:
+            latest: dict[int, int] = {}
+            for task_id in {v.task_id for v in created}:
+                cursor = conn.execute(
+                    "SELECT MAX(version_number) FROM versions WHERE task_id = ?",
+                    (task_id,),
+                )
+                latest[task_id] = cursor.fetchone()[0] or 0
+            for version in created:
+                latest[version.task_id] += 1
+                version.version_number = latest[version.task_id]
+            
+            ids = self._insert_many(
+                conn,
+                """INSERT INTO versions
+                       (task_id, version_number, path, notes, created_by, created_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        v.task_id, v.version_number, v.path, v.notes, v.created_by,
+                        now, json.dumps(v.metadata),
+                    )
+                    for v in created
+                ],
+            )
+        
+        for version, version_id in zip(created, ids):
+            version.id = version_id
+        return created
+    
+    def get_version(self, version_id: int) -> Optional[Version]:
+        """Get a version by ID."""
+        version, epoch = self._cached(("version", version_id))
+        if version is not None:
+            return version
+        with self._pool.read() as conn:
+            row = conn.execute(
+                f"SELECT {_VERSION_COLUMNS} FROM versions WHERE id = ?", (version_id,)
+            ).fetchone()
+        if not row:
+            return None
+        version = self._row_to_version(row)
+        self._remember(("version", version_id), version, epoch)
+        return version
+    
+    def find_versions(
+        self,
+        task: Optional[Union[Task, int]] = None,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> list[Version]:
+        """Find versions with optional filters.
+        
+        `metadata` filters on top-level metadata keys by equality, inside
+        SQLite; see `index_metadata` for keys queried often.
+        
+        Results are ordered by ID. Pass `limit` for one page at a time and
+        the last ID seen as `after` to fetch the next page.
+        """
+        query, params = self._version_query(task, status, created_by, metadata)
+        query = self._paginate(query, params, limit, after)
+        with self._pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return list(map(self._row_to_version, rows))
+    
+    def iter_versions(
+        self,
+        task: Optional[Union[Task, int]] = None,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Version]:
+        """Iterate over versions in ID order, fetching `chunk_size` rows at a time."""
+        query, params = self._version_query(task, status, created_by, metadata)
+        return self._iterate(query + " ORDER BY id", params, self._row_to_version, chunk_size)
+    
+    def count_versions(
+        self,
+        task: Optional[Union[Task, int]] = None,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Count versions matching the same filters as `find_versions`."""
+        if task is None and not (status or created_by or metadata):
+            return self._total("versions")
+        return self._count(*self._version_query(task, status, created_by, metadata, "COUNT(*)"))
+    
+    def _version_query(
+        self,
+        task: Optional[Union[Task, int]],
+        status: Optional[str],
+        created_by: Optional[str],
+        metadata: Optional[dict[str, Any]],
+        columns: str = _VERSION_COLUMNS,
+    ) -> tuple[str, list[Any]]:
+        query = f"SELECT {columns} FROM versions WHERE 1=1"
+        params: list[Any] = []
+        
+        if task is not None:
+            query += " AND task_id = ?"
+            params.append(task.id if isinstance(task, Task) else task)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        if created_by:
+            query += " AND created_by = ?"
+            params.append(created_by)
+        if metadata:
+            query += self._metadata_filter(metadata, params)
+        return query, params
+    
+    @staticmethod
+    def _row_to_version(row: tuple) -> Version:
+        (
+            id, task_id, version_number, status, path, thumbnail,
+            notes, created_by, created_at, metadata,
+        ) = row
+        return Version(
+            id,
+            task_id,
+            version_number,
+            status,
+            path,
+            thumbnail,
+            notes,
+            created_by,
+            created_at or datetime.now(),
+            metadata or "{}",
+        )
+    
+    # =========================================================================
+    # Summary
+    # =========================================================================
+    
+    def status_summary(
+        self, project: Union[Project, int, str]
+    ) -> dict[str, dict[str, dict[str, int]]]:
+        """Count a project's assets, shots and tasks by category and status.
+        
+        Reads the trigger-maintained rollup table, so the cost depends on
+        the number of distinct categories and statuses, not on the number
+        of entities. Categories are the asset type, shot sequence and task
+        name.
+        
+        Example:
+            studio.status_summary("MYFILM")
+            # {"asset": {"character": {"waiting": 3, "approved": 1}},
+            #  "shot": {"SQ010": {"in_progress": 12}},
+            #  "task": {"model": {"review": 2}}}
+        """
+        project_id = self._resolve_project_id(project)
+        with self._pool.read() as conn:
+            rows = conn.execute(
+                "SELECT entity_type, category, status, count FROM status_rollup"
+                " WHERE project_id = ? AND count > 0",
+                (project_id,),
+            ).fetchall()
+        summary: dict[str, dict[str, dict[str, int]]] = {"asset": {}, "shot": {}, "task": {}}
+        for entity_type, category, status, count in rows:
+            summary[entity_type].setdefault(category, {})[status] = count
+        return summary
+    
+    # =========================================================================
+    # Change feed
+    # =========================================================================
+    
+    def changes_since(
+        self,
+        seq: int = 0,
+        limit: int = 1000,
+        project: Optional[Union[Project, int, str]] = None,
+    ) -> list[Change]:
+        """Return feed entries after `seq`, oldest first.
+        
+        Every insert, update and delete on projects, assets, shots, tasks
+        and versions is logged by triggers, whichever connection made it.
+        Pass the `seq` of the last entry seen to continue; an empty list
+        means the caller is up to date. With `project`, only entries for
+        that project are returned.
+        """
+        query = "SELECT seq, entity_type, entity_id, op, project_id FROM changes WHERE seq > ?"
+        params: list[Any] = [seq]
+        if project:
+            query += " AND project_id = ?"
+            params.append(self._resolve_project_id(project))
+        query += " ORDER BY seq LIMIT ?"
+        params.append(limit)
+        with self._pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [Change(*row) for row in rows]
+    
+    def last_change(self) -> int:
+        """Sequence number of the newest feed entry ever written, or 0.
+        
+        Read from the AUTOINCREMENT counter rather than the table, so it
+        keeps increasing after `prune_changes` empties the feed.
+        """
+        with self._pool.read() as conn:
+            row = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'changes'"
+            ).fetchone()
+        return row[0] if row else 0
+    
+    def prune_changes(self, before: int) -> int:
+        """Delete feed entries with a sequence number below `before`.
+        
+        Returns the number of entries removed. Clients that were further
+        behind should resync from full lists.
+        """
+        with self._pool.write() as conn:
+            return conn.execute("DELETE FROM changes WHERE seq < ?", (before,)).rowcount
+    
+    # =========================================================================
+    # Search
+    # =========================================================================
+    
+    def search(self, query: str, limit: int = 50) -> list[Union[Asset, Shot, Task, Version]]:
+        """Full-text search over assets, shots, tasks and versions.
+        
+        Every word in `query` must match, as a prefix, the name or the
+        description (version path and notes, task assignee) of a result.
+        Results are ranked by relevance with name matches weighted highest.
+        
+        Example:
+            studio.search("hero rig")  # -> [Asset(hero), Task(rig), ...]
+        """
+        # Quote each word so FTS5 operators and punctuation in user input
+        # are matched literally instead of parsed as query syntax.
+        terms = ['"{}"*'.format(word.replace('"', '""')) for word in query.split()]
+        if not terms:
+            return []
+        with self._pool.read() as conn:
+            rowids = [
+                rowid for (rowid,) in conn.execute(
+                    "SELECT rowid FROM search WHERE search MATCH ?"
+                    " ORDER BY bm25(search, 10.0, 1.0) LIMIT ?",
+                    [" ".join(terms), limit],
+                )
+            ]
+        
+        found: dict[int, Any] = {}
+        for kind, (table, columns, decode) in enumerate((
+            ("assets", _ASSET_COLUMNS, self._row_to_asset),
+            ("shots", _SHOT_COLUMNS, self._row_to_shot),
+            ("tasks", _TASK_COLUMNS, self._row_to_task),
+            ("versions", _VERSION_COLUMNS, self._row_to_version),
+        )):
+            ids = [rowid >> 2 for rowid in rowids if rowid & 3 == kind]
+            if ids:
+                for entity in self._select_in(
+                    f"SELECT {columns} FROM {table} WHERE id IN ({{}})", [], ids, decode
+                ):
+                    found[entity.id * 4 + kind] = entity
+        return [found[rowid] for rowid in rowids if rowid in found]
+    
     # =========================================================================
     # Helpers
     # =========================================================================
@@ -441,7 +1939,217 @@ class Studio:
         if isinstance(project, int):
             return project
         # Assume it's a code
-        proj = self.get_project(project)
-        if not proj:
+        project_id = self._project_ids.get(project)
+        if project_id is not None:
+            return project_id
+        with self._pool.read() as conn:
+            row = conn.execute("SELECT id FROM projects WHERE code = ?", (project,)).fetchone()
+        if not row:
             raise ValueError(f"Project not found: {project}")
-        return proj.id
+        self._remember_project_id(project, row[0])
+        return row[0]
+    
+    def _remember_project_id(self, code: str, project_id: int) -> None:
+        # Deferred inside a transaction, like _remember: a code cached before
+        # COMMIT would let other threads write rows under a project that
+        # may yet be rolled back.
+        self._pool.after_commit(functools.partial(self._project_ids.__setitem__, code, project_id))
+    
+    def _total(self, table: str) -> int:
+        """Unfiltered row count, read from the trigger-maintained counters."""
+        with self._pool.read() as conn:
+            row = conn.execute(
+                "SELECT count FROM entity_counts WHERE entity_type = ?", (table,)
+            ).fetchone()
+        return row[0] if row else 0
+    
+    def _count(self, query: str, params: list[Any]) -> int:
+        with self._pool.read() as conn:
+            return conn.execute(query, params).fetchone()[0]
+    
+    @staticmethod
+    def _check_metadata_key(key: str) -> None:
+        if not isinstance(key, str) or not _METADATA_KEY.match(key):
+            raise ValueError(f"Invalid metadata key: {key!r}")
+    
+    @classmethod
+    def _metadata_filter(
+        cls,
+        metadata: dict[str, Any],
+        params: list[Any],
+        column: str = "metadata",
+    ) -> str:
+        """Compile {key: value} into `json_extract` equality predicates.
+        
+        The key path is inlined rather than bound so the expression matches
+        indexes created by `index_metadata`. None matches a null or missing
+        key; lists and dicts compare as minified JSON.
+        """
+        sql = ""
+        for key, value in metadata.items():
+            cls._check_metadata_key(key)
+            expr = f"json_extract({column}, '$.{key}')"
+            if value is None:
+                sql += f" AND {expr} IS NULL"
+            elif isinstance(value, (dict, list)):
+                sql += f" AND {expr} = json(?)"
+                params.append(json.dumps(value))
+            else:
+                sql += f" AND {expr} = ?"
+                params.append(value)
+        return sql
+    
+    @staticmethod
+    def _check_include(include: Collection[str], allowed: tuple[str, ...]) -> None:
+        unknown = set(include) - set(allowed)
+        if unknown:
+            raise ValueError(
+                f"Cannot include {', '.join(sorted(unknown))}; expected one of {', '.join(allowed)}"
+            )
+    
+    def _load_tasks(
+        self,
+        entities: list[Union[Asset, Shot]],
+        entity_type: str,
+        with_versions: bool = False,
+    ) -> None:
+        """Attach tasks to assets or shots, batching IDs into IN (...) queries."""
+        by_id = {entity.id: entity for entity in entities}
+        for entity in entities:
+            entity.tasks = []
+        tasks = self._select_in(
+            f"SELECT {_TASK_COLUMNS} FROM tasks"
+            " WHERE entity_type = ? AND entity_id IN ({}) ORDER BY id",
+            [entity_type],
+            list(by_id),
+            self._row_to_task,
+        )
+        for task in tasks:
+            entity = by_id[task.entity_id]
+            task.entity = entity
+            entity.tasks.append(task)
+        if with_versions:
+            self._load_versions(tasks)
+    
+    def _load_versions(self, tasks: list[Task]) -> None:
+        """Attach versions to tasks, batching IDs into IN (...) queries."""
+        by_id = {task.id: task for task in tasks}
+        for task in tasks:
+            task.versions = []
+        versions = self._select_in(
+            f"SELECT {_VERSION_COLUMNS} FROM versions WHERE task_id IN ({{}}) ORDER BY id",
+            [],
+            list(by_id),
+            self._row_to_version,
+        )
+        for version in versions:
+            task = by_id[version.task_id]
+            version.task = task
+            task.versions.append(version)
+    
+    def _select_in(
+        self,
+        query: str,
+        params: list[Any],
+        ids: list[int],
+        decode: Callable[[tuple], Any],
+    ) -> list[Any]:
+        """Run a query whose `{}` placeholder takes a list of IDs.
+        
+        IDs are sent in chunks to stay under SQLite's bound-variable limit.
+        """
+        results: list[Any] = []
+        with self._pool.read() as conn:
+            for start in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[start:start + _IN_CHUNK]
+                rows = conn.execute(
+                    query.format(", ".join("?" * len(chunk))),
+                    params + chunk,
+                ).fetchall()
+                results.extend(map(decode, rows))
+        return results
+    
+    def _iterate(
+        self,
+        query: str,
+        params: list[Any],
+        decode: Callable[[tuple], Any],
+        chunk_size: int,
+    ) -> Iterator[Any]:
+        """Stream decoded rows with fetchmany, holding one chunk at a time.
+        
+        On file databases the query runs against a single WAL read
+        snapshot, so the iteration sees a consistent view even while writes
+        continue.
+        """
+        with self._pool.read() as conn:
+            cursor = conn.execute(query, params)
+            rows = cursor.fetchmany(chunk_size)
+        try:
+            while rows:
+                yield from map(decode, rows)
+                # Re-enter the pool only for the lock it takes on shared
+                # in-memory connections; the cursor stays where it started.
+                with self._pool.read():
+                    rows = cursor.fetchmany(chunk_size)
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _paginate(
+        query: str,
+        params: list[Any],
+        limit: Optional[int],
+        after: Optional[int],
+    ) -> str:
+        """Add keyset pagination on ID to a filtered query."""
+        if after is not None:
+            query += " AND id > ?"
+            params.append(after)
+        query += " ORDER BY id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query
+    
+    def _cached(self, key: tuple) -> tuple[Any, Optional[int]]:
+        """Look up an entity in the identity map, if enabled.
+        
+        Returns the entity (or None) and the cache epoch to pass back to
+        `_remember` if the caller goes on to read it from the database.
+        """
+        if self._cache is None:
+            return None, None
+        epoch = self._cache.epoch
+        return self._cache.get(key), epoch
+    
+    def _remember(self, key: tuple, entity: Any, epoch: Optional[int] = None) -> None:
+        """Store an entity in the identity map, if enabled.
+        
+        Inside a transaction the entity may not be committed yet: the old
+        entry is dropped now and the new one stored after the COMMIT.
+        Entities read outside one pass the `epoch` from `_cached`, so a row
+        read before a concurrent write committed cannot replace its result.
+        """
+        if self._cache is None:
+            return
+        if self._pool.writing:
+            self._cache.invalidate(key)
+            self._pool.after_commit(functools.partial(self._cache.put, key, entity))
+        else:
+            self._cache.put(key, entity, epoch)
+    
+    def _insert_many(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        rows: list[tuple],
+    ) -> range:
+        """Insert rows with executemany and return their new IDs."""
+        if not rows:
+            return range(0)
+        conn.executemany(sql, rows)
+        # The writer holds the only write lock for the whole statement, so
+        # AUTOINCREMENT hands out a contiguous block ending at the last ID.
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return range(last_id - len(rows) + 1, last_id + 1)
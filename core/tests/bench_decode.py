@@ -0,0 +1,152 @@
+"""Benchmark decoding task rows into models.
+
+Compares Studio's positional decoding (explicit column lists, plain tuples,
+slotted models with lazily parsed timestamps and metadata) with the decoder
+Studio had before: `SELECT *` through sqlite3.Row name lookups into a plain
+dataclass, parsing every timestamp and metadata blob up front. A third run
+reads created_at and metadata of every positionally decoded task, which is
+the worst case for lazy parsing, and a last one only fetches the rows,
+which is the floor for any decoder. Not collected by pytest; run it as
+
+    python core/tests/bench_decode.py [--tasks 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from opengrid import Studio
+
+
+@dataclass
+class BaselineTask:
+    """Task as it was defined before positional decoding."""
+    id: int
+    entity_type: str
+    entity_id: int
+    name: str
+    status: str = "waiting"
+    assignee: Optional[str] = None
+    due_date: Optional[datetime] = None
+    priority: int = 50
+    created_at: datetime = field(default_factory=datetime.now)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    entity: Any = None
+    versions: list[Any] = field(default_factory=list)
+
+
+def build(path: Path, n_tasks: int) -> None:
+    studio = Studio(path)
+    project = studio.create_project("Bench", "BENCH")
+    assets = studio.create_assets_bulk(
+        project, [{"name": f"asset{i:06d}", "asset_type": "prop"} for i in range(n_tasks // 5)]
+    )
+    names = ("model", "rig", "lookdev", "fx", "layout")
+    studio.create_tasks_bulk(
+        {"entity": asset, "name": name, "assignee": "artist"}
+        for asset in assets
+        for name in names
+    )
+    studio.close()
+
+
+def decode_positional(path: Path) -> Callable[[], int]:
+    studio = Studio(path)
+    return lambda: len(studio.find_tasks())
+
+
+def decode_positional_read(path: Path) -> Callable[[], int]:
+    studio = Studio(path)
+
+    def run() -> int:
+        tasks = studio.find_tasks()
+        for task in tasks:
+            task.created_at, task.metadata
+        return len(tasks)
+
+    return run
+
+
+def fetch_only(path: Path) -> Callable[[], int]:
+    studio = Studio(path)
+    query, params = studio._task_query(None, None, None, None)
+
+    def run() -> int:
+        with studio._pool.read() as conn:
+            return len(conn.execute(query, params).fetchall())
+
+    return run
+
+
+def decode_baseline(path: Path) -> Callable[[], int]:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+
+    def row_to_task(row: sqlite3.Row) -> BaselineTask:
+        return BaselineTask(
+            id=row["id"],
+            entity_type=row["entity_type"],
+            entity_id=row["entity_id"],
+            name=row["name"],
+            status=row["status"],
+            assignee=row["assignee"],
+            due_date=datetime.fromisoformat(row["due_date"]) if row["due_date"] else None,
+            priority=row["priority"],
+            created_at=(
+                datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now()
+            ),
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+        )
+
+    def run() -> int:
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM tasks WHERE 1=1", [])
+        return len([row_to_task(row) for row in cursor.fetchall()])
+
+    return run
+
+
+def best_of(run: Callable[[], int], repeat: int) -> tuple[float, int]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = run()
+        times.append(time.perf_counter() - start)
+    return min(times), rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        build(path, args.tasks)
+        runs = [
+            ("baseline", decode_baseline),
+            ("positional", decode_positional),
+            ("+ fields read", decode_positional_read),
+            ("fetch only", fetch_only),
+        ]
+        baseline = None
+        for label, factory in runs:
+            elapsed, rows = best_of(factory(path), args.repeat)
+            baseline = baseline or elapsed
+            print(
+                f"{label:>13}: {elapsed * 1000:7.1f} ms for {rows} tasks"
+                f" ({baseline / elapsed:.1f}x, best of {args.repeat})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""IDs returned by the create_*_bulk methods match the rows they stored."""
+
+import pytest
+from opengrid import Studio
+
+
+@pytest.fixture
+def studio(tmp_path):
+    studio = Studio(tmp_path / "studio.db")
+    yield studio
+    studio.close()
+
+
+def _stored(studio, table, columns, ids):
+    with studio._pool.read() as conn:
+        rows = conn.execute(
+            f"SELECT id, {columns} FROM {table} WHERE id IN ({', '.join('?' * len(ids))})",
+            list(ids),
+        ).fetchall()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def test_bulk_ids_match_stored_rows(studio):
+    film = studio.create_project("Film", "FILM")
+    # Existing and deleted rows, so new IDs do not start at 1 and the
+    # highest ID ever used is not the highest one still stored.
+    studio.create_asset(film, "old", "prop")
+    doomed = studio.create_asset(film, "doomed", "prop")
+    with studio._pool.write() as conn:
+        conn.execute("DELETE FROM assets WHERE id = ?", (doomed.id,))
+
+    assets = studio.create_assets_bulk(
+        film, [{"name": f"a{i}", "asset_type": f"type{i % 3}"} for i in range(50)]
+    )
+    assert _stored(studio, "assets", "name, asset_type", [a.id for a in assets]) == {
+        a.id: (a.name, a.asset_type) for a in assets
+    }
+    assert assets[0].id > doomed.id
+
+    shots = studio.create_shots_bulk(
+        film, [{"sequence": "SQ010", "name": f"sh{i}", "frame_start": i} for i in range(50)]
+    )
+    assert _stored(studio, "shots", "name, frame_start", [s.id for s in shots]) == {
+        s.id: (s.name, s.frame_start) for s in shots
+    }
+
+    tasks = studio.create_tasks_bulk(
+        [{"entity": asset, "name": "model"} for asset in assets]
+        + [{"entity": shot, "name": "anim"} for shot in shots]
+    )
+    assert _stored(studio, "tasks", "entity_type, entity_id, name",
+                   [t.id for t in tasks]) == {
+        t.id: (t.entity_type, t.entity_id, t.name) for t in tasks
+    }
+    for task in tasks[::17]:
+        assert studio.get_task(task.id).entity_id == task.entity_id
+
+    versions = studio.create_versions_bulk(
+        [{"task": task, "path": f"/v/{task.id}"} for task in tasks[:20]]
+    )
+    assert _stored(studio, "versions", "task_id, path", [v.id for v in versions]) == {
+        v.id: (v.task_id, v.path) for v in versions
+    }
+
+
+def test_bulk_ids_inside_a_larger_transaction(studio):
+    film = studio.create_project("Film", "FILM")
+    with studio.transaction():
+        first = studio.create_assets_bulk(film, [{"name": "a", "asset_type": "prop"}])
+        single = studio.create_asset(film, "b", "prop")
+        rest = studio.create_assets_bulk(
+            film, [{"name": name, "asset_type": "prop"} for name in "cde"]
+        )
+
+    created = first + [single] + rest
+    assert [a.id for a in created] == list(range(first[0].id, first[0].id + 5))
+    assert {a.id: a.name for a in studio.find_assets(film)} == {
+        a.id: a.name for a in created
+    }
+
+
+def test_version_numbers_continue_per_task(studio):
+    film = studio.create_project("Film", "FILM")
+    hero = studio.create_asset(film, "hero", "character")
+    model, rig, look = studio.create_tasks_bulk(
+        [{"entity": hero, "name": name} for name in ("model", "rig", "look")]
+    )
+    studio.create_version(model, "/model/v001")
+    studio.create_version(model, "/model/v002")
+    studio.create_version(rig, "/rig/v001")
+
+    versions = studio.create_versions_bulk([
+        {"task": model, "path": "/model/v003"},
+        {"task": rig.id, "path": "/rig/v002"},
+        {"task": look, "path": "/look/v001"},
+        {"task": model, "path": "/model/v004"},
+        {"task": look, "path": "/look/v002"},
+    ])
+
+    assert [(v.task_id, v.version_number) for v in versions] == [
+        (model.id, 3), (rig.id, 2), (look.id, 1), (model.id, 4), (look.id, 2),
+    ]
+    assert _stored(studio, "versions", "task_id, version_number, path",
+                   [v.id for v in versions]) == {
+        v.id: (v.task_id, v.version_number, v.path) for v in versions
+    }
+    for task in (model, rig, look):
+        numbers = [v.version_number for v in studio.find_versions(task=task)]
+        assert sorted(numbers) == list(range(1, len(numbers) + 1))
+
+
+def test_empty_bulk_creates_nothing(studio):
+    film = studio.create_project("Film", "FILM")
+    assert studio.create_assets_bulk(film, []) == []
+    assert studio.create_shots_bulk(film, []) == []
+    assert studio.create_tasks_bulk([]) == []
+    assert studio.create_versions_bulk([]) == []
+    assert studio.last_change() == 1
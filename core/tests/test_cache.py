@@ -0,0 +1,57 @@
+"""The identity map stays consistent with writes made through Studio."""
+
+import threading
+
+from opengrid import Studio
+from opengrid.cache import EntityCache
+
+
+def test_read_path_put_is_dropped_after_a_write():
+    cache = EntityCache()
+    epoch = cache.epoch
+    cache.put("key", "new")
+    cache.put("key", "old", epoch)
+    assert cache.get("key") == "new"
+
+    epoch = cache.epoch
+    cache.invalidate("key")
+    cache.put("key", "old", epoch)
+    assert cache.get("key") is None
+
+    epoch = cache.epoch
+    cache.put("key", "fresh", epoch)
+    assert cache.get("key") == "fresh"
+
+
+def test_stale_read_cannot_replace_a_concurrent_update(tmp_path):
+    studio = Studio(tmp_path / "studio.db", cache_size=100)
+    project = studio.create_project("Film", "FILM")
+    asset = studio.create_asset(project, "hero", "character")
+    task = studio.create_task(asset, "model")
+    studio._cache.clear()
+
+    # Hold the reader between reading the old row and caching it while
+    # another thread commits an update.
+    row_read = threading.Event()
+    updated = threading.Event()
+    decode = studio._row_to_task
+
+    def paused_decode(row):
+        row_read.set()
+        assert updated.wait(5)
+        return decode(row)
+
+    studio._row_to_task = paused_decode
+    result = []
+    reader = threading.Thread(target=lambda: result.append(studio.get_task(task.id)))
+    reader.start()
+    assert row_read.wait(5)
+    del studio._row_to_task
+
+    studio.update_task(task.id, status="approved")
+    updated.set()
+    reader.join(5)
+
+    assert result[0].status == "waiting"
+    assert studio.get_task(task.id).status == "approved"
+    studio.close()
@@ -0,0 +1,116 @@
+"""The trigger-fed change feed: ordering, gaps, project filter and pruning."""
+
+import pytest
+from opengrid import Studio
+
+
+@pytest.fixture
+def studio(tmp_path):
+    studio = Studio(tmp_path / "studio.db")
+    yield studio
+    studio.close()
+
+
+def _feed(studio, **kwargs):
+    return [(c.entity_type, c.entity_id, c.op, c.project_id)
+            for c in studio.changes_since(**kwargs)]
+
+
+def _assert_gap_free(changes, start=1):
+    assert [c.seq for c in changes] == list(range(start, start + len(changes)))
+
+
+def test_every_write_is_logged_once_in_order(studio):
+    film = studio.create_project("Film", "FILM")
+    hero = studio.create_asset(film, "hero", "character")
+    shot = studio.create_shot(film, "SQ010", "sh010")
+    model = studio.create_task(hero, "model")
+    anim = studio.create_tasks_bulk([{"entity": shot, "name": "anim"}])[0]
+    version = studio.create_version(model, "/hero/v001.ma")
+    studio.update_task(model, status="approved")
+    studio.update_shot(shot, status="final")
+    with studio._pool.write() as conn:
+        conn.execute("DELETE FROM tasks WHERE id = ?", (anim.id,))
+
+    assert _feed(studio) == [
+        ("project", film.id, "insert", film.id),
+        ("asset", hero.id, "insert", film.id),
+        ("shot", shot.id, "insert", film.id),
+        ("task", model.id, "insert", film.id),
+        ("task", anim.id, "insert", film.id),
+        ("version", version.id, "insert", film.id),
+        ("task", model.id, "update", film.id),
+        ("shot", shot.id, "update", film.id),
+        ("task", anim.id, "delete", film.id),
+    ]
+    changes = studio.changes_since()
+    _assert_gap_free(changes)
+    assert studio.last_change() == changes[-1].seq
+
+
+def test_rolled_back_writes_leave_no_gap(studio):
+    film = studio.create_project("Film", "FILM")
+    with pytest.raises(RuntimeError):
+        with studio.transaction():
+            studio.create_asset(film, "hero", "character")
+            raise RuntimeError
+    with studio.transaction():
+        studio.create_asset(film, "crate", "prop")
+        with pytest.raises(RuntimeError):
+            with studio.transaction():
+                studio.create_asset(film, "villain", "character")
+                raise RuntimeError
+        studio.create_asset(film, "lamp", "prop")
+
+    changes = studio.changes_since()
+    _assert_gap_free(changes)
+    assert [c.entity_type for c in changes] == ["project", "asset", "asset"]
+    assert studio.last_change() == 3
+
+
+def test_paging_and_project_filter(studio):
+    film = studio.create_project("Film", "FILM")
+    promo = studio.create_project("Promo", "PROMO")
+    studio.create_assets_bulk(film, [{"name": f"a{i}", "asset_type": "prop"} for i in range(5)])
+    studio.create_assets_bulk(promo, [{"name": f"b{i}", "asset_type": "prop"} for i in range(5)])
+
+    pages, seq = [], 0
+    while page := studio.changes_since(seq, limit=3):
+        pages.append(page)
+        seq = page[-1].seq
+    assert [len(page) for page in pages] == [3, 3, 3, 3]
+    _assert_gap_free([c for page in pages for c in page])
+
+    promo_changes = studio.changes_since(project="PROMO")
+    assert {c.project_id for c in promo_changes} == {promo.id}
+    assert len(promo_changes) == 6
+    assert studio.changes_since(promo_changes[2].seq, project=promo) == promo_changes[3:]
+
+
+def test_feed_survives_pruning(studio):
+    film = studio.create_project("Film", "FILM")
+    studio.create_assets_bulk(film, [{"name": f"a{i}", "asset_type": "prop"} for i in range(9)])
+    assert studio.last_change() == 10
+
+    assert studio.prune_changes(4) == 3
+    remaining = studio.changes_since()
+    _assert_gap_free(remaining, start=4)
+    assert studio.changes_since(5) == remaining[2:]
+    assert studio.last_change() == 10
+
+    assert studio.prune_changes(studio.last_change() + 1) == 7
+    assert studio.changes_since() == []
+    assert studio.last_change() == 10
+
+    # Sequence numbers keep counting up after the feed is emptied, so a
+    # client holding seq 10 still sees the next write.
+    asset = studio.create_asset(film, "hero", "character")
+    assert _feed(studio, seq=10) == [("asset", asset.id, "insert", film.id)]
+    assert studio.changes_since()[0].seq == 11
+    assert studio.last_change() == 11
+
+
+def test_last_change_of_a_new_database_is_zero(studio):
+    assert studio.last_change() == 0
+    assert studio.changes_since() == []
+    assert studio.prune_changes(100) == 0
@@ -0,0 +1,39 @@
+"""Concurrent writers in separate processes sharing one database file."""
+
+import multiprocessing
+
+from opengrid import Studio
+
+PROCESSES = 16
+CALLS = 100
+
+
+def _publish(path: str, task_id: int, calls: int) -> list[int]:
+    studio = Studio(path)
+    try:
+        return [studio.create_version(task_id).version_number for _ in range(calls)]
+    finally:
+        studio.close()
+
+
+def test_create_version_numbers_are_gapless_across_processes(tmp_path):
+    path = str(tmp_path / "studio.db")
+    studio = Studio(path)
+    project = studio.create_project("Stress", "STRESS")
+    asset = studio.create_asset(project, "hero", "character")
+    task = studio.create_task(asset, "model")
+    studio.close()
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(PROCESSES) as pool:
+        results = pool.starmap(_publish, [(path, task.id, CALLS)] * PROCESSES)
+
+    for numbers in results:
+        assert numbers == sorted(numbers)
+    allocated = sorted(n for numbers in results for n in numbers)
+    assert allocated == list(range(1, PROCESSES * CALLS + 1))
+
+    studio = Studio(path)
+    stored = [v.version_number for v in studio.find_versions(task=task.id)]
+    studio.close()
+    assert sorted(stored) == allocated
@@ -0,0 +1,51 @@
+"""What Studio.enable_instrumentation() records about each call."""
+
+import pytest
+from opengrid import Studio
+
+
+@pytest.fixture
+def studio(tmp_path):
+    studio = Studio(tmp_path / "studio.db")
+    studio.enable_instrumentation()
+    yield studio
+    studio.close()
+
+
+def test_records_hold_no_argument_values(studio):
+    project = studio.create_project("Secret Film", "SECRET", description="codename")
+    studio.create_asset(project, "hero", "character", metadata={"lod": "high"})
+    studio.find_assets("SECRET", asset_type="character", metadata={"lod": "high"})
+
+    records = list(studio.instrumentation.records)
+    assert [r.method for r in records] == ["create_project", "create_asset", "find_assets"]
+    assert records[2].args == ("str", "asset_type=str", "metadata=dict")
+    text = repr(records)
+    for value in ("Secret Film", "SECRET", "codename", "hero", "character", "high"):
+        assert value not in text
+    select = [s for s in records[2].statements if s.lstrip().startswith("SELECT")]
+    assert select and all("?" in s for s in select)
+    # The metadata key is part of the SQL text, not a bound value.
+    assert any("$.lod" in s for s in select)
+
+
+def test_bulk_insert_is_one_statement(studio):
+    project = studio.create_project("Film", "FILM")
+    studio.create_assets_bulk(
+        project, [{"name": f"a{i}", "asset_type": "prop"} for i in range(200)]
+    )
+
+    record = studio.instrumentation.records[-1]
+    inserts = [s for s in record.statements if "INSERT INTO assets" in s]
+    assert len(inserts) == 1
+    assert record.rows == 200
+
+
+def test_recorded_selects_can_be_explained(studio):
+    studio.create_project("Film", "FILM")
+    studio.find_assets("FILM", status="wip")
+    statement = next(
+        s for s in studio.instrumentation.records[-1].statements
+        if s.lstrip().startswith("SELECT")
+    )
+    assert studio.explain(statement, [None] * statement.count("?"))
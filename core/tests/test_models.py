@@ -0,0 +1,70 @@
+"""Memory layout of the models: slots, lazy text fields and lazy relationships."""
+
+import tracemalloc
+from datetime import datetime
+
+import pytest
+from opengrid import Asset, Change, Project, Shot, Studio, Task, Version
+
+
+def _models():
+    return [
+        Project(1, "Film", "FILM"),
+        Asset(1, 1, "hero", "character"),
+        Shot(1, 1, "sq010", "sh010"),
+        Task(1, "asset", 1, "model"),
+        Version(1, 1, 1),
+        Change(1, "task", 1, "insert"),
+    ]
+
+
+@pytest.mark.parametrize("model", _models(), ids=lambda m: type(m).__name__)
+def test_models_have_no_instance_dict(model):
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        model.not_a_field = 1
+
+
+@pytest.mark.parametrize(
+    "model, field",
+    [
+        (Asset(1, 1, "hero", "character"), "tasks"),
+        (Shot(1, 1, "sq010", "sh010"), "tasks"),
+        (Task(1, "asset", 1, "model"), "versions"),
+    ],
+    ids=["asset-tasks", "shot-tasks", "task-versions"],
+)
+def test_relationship_lists_are_allocated_on_first_read(model, field):
+    slot = getattr(type(model), field).slot
+    assert slot.__get__(model) is None
+    value = getattr(model, field)
+    assert value == []
+    assert slot.__get__(model) is value
+    assert getattr(model, field) is value
+
+
+def test_raw_text_is_decoded_on_first_read():
+    task = Task(1, "asset", 1, "model", created_at="2024-05-01T12:00:00", metadata='{"a": 1}')
+    assert type(task).created_at.slot.__get__(task) == "2024-05-01T12:00:00"
+    assert task.created_at == datetime(2024, 5, 1, 12)
+    assert task.metadata == {"a": 1}
+    assert type(task).metadata.slot.__get__(task) == {"a": 1}
+
+
+def test_task_footprint():
+    # Rows as SQLite returns them; decoding keeps the same str objects, so
+    # only the Task instances themselves should be allocated.
+    rows = [
+        (i, "asset", i, "model", "waiting", "alice", None, 50, "2024-05-01T12:00:00", "{}")
+        for i in range(20_000)
+    ]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tasks = [Studio._row_to_task(row) for row in rows]
+        per_task = (tracemalloc.get_traced_memory()[0] - before) / len(tasks)
+    finally:
+        tracemalloc.stop()
+    # About 137 bytes on CPython 3.11; a per-instance __dict__ or eagerly
+    # allocated lists would more than double it.
+    assert per_task < 200, per_task
@@ -0,0 +1,43 @@
+"""Connection lifetime in ConnectionPool."""
+
+import sqlite3
+import threading
+
+import pytest
+from opengrid import Studio
+
+
+def test_reader_connections_close_when_their_thread_exits(tmp_path):
+    studio = Studio(tmp_path / "studio.db")
+    studio.create_project("Film", "FILM")
+    pool = studio._pool
+    used = []
+
+    def read():
+        assert studio.get_project("FILM") is not None
+        used.append(pool._reader())
+
+    for _ in range(200):
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+    assert len(used) == 200
+    assert len(pool._readers) == 0
+    for conn in used:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    studio.close()
+
+
+def test_close_releases_readers_of_live_threads(tmp_path):
+    studio = Studio(tmp_path / "studio.db")
+    studio.create_project("Film", "FILM")
+    studio.get_project("FILM")
+    conn = studio._pool._reader()
+
+    studio.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError):
+        studio.get_project("FILM")
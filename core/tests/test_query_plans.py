@@ -0,0 +1,136 @@
+"""Every find_*/count_* filter combination is answered from an index."""
+
+import itertools
+
+import pytest
+from opengrid import Studio
+
+
+@pytest.fixture(scope="module")
+def studio(tmp_path_factory):
+    studio = Studio(tmp_path_factory.mktemp("plans") / "studio.db")
+    project = studio.create_project("Plans", "PLANS", metadata={"client": "acme"})
+    asset = studio.create_asset(
+        project, "hero", "character", status="wip", metadata={"lod": "high"}
+    )
+    shot = studio.create_shot(
+        project, "sq010", "sh010", frame_start=1001, frame_end=1100,
+        status="wip", metadata={"cam": "a"},
+    )
+    for entity in (asset, shot):
+        task = studio.create_task(
+            entity, "model", status="wip", assignee="alice", metadata={"dept": "mdl"}
+        )
+        studio.create_version(task, created_by="alice", metadata={"lens": "50"})
+    for entity_type, key in [
+        ("project", "client"),
+        ("asset", "lod"),
+        ("shot", "cam"),
+        ("task", "dept"),
+        ("version", "lens"),
+    ]:
+        studio.index_metadata(entity_type, key)
+    studio.enable_instrumentation()
+    yield studio
+    studio.close()
+
+
+@pytest.fixture(scope="module")
+def values(studio):
+    """A value matching the fixture rows for every filter argument, by entity."""
+    asset = studio.get_asset("PLANS", "hero")
+    task = studio.find_tasks(entity=asset)[0]
+    return {
+        "projects": {"status": "active", "metadata": {"client": "acme"}},
+        "assets": {
+            "project": "PLANS",
+            "asset_type": "character",
+            "status": "wip",
+            "metadata": {"lod": "high"},
+        },
+        "shots": {
+            "project": "PLANS",
+            "sequence": "sq010",
+            "status": "wip",
+            "overlapping": (1050, 1060),
+            "metadata": {"cam": "a"},
+        },
+        "tasks": {
+            "entity": asset,
+            "status": "wip",
+            "assignee": "alice",
+            "metadata": {"dept": "mdl"},
+        },
+        "versions": {
+            "task": task,
+            "status": "pending_review",
+            "created_by": "alice",
+            "metadata": {"lens": "50"},
+        },
+        "project_tasks": {"status": "wip", "assignee": "alice", "metadata": {"dept": "mdl"}},
+    }
+
+
+_FILTERS = {
+    "projects": ["status", "metadata"],
+    "assets": ["project", "asset_type", "status", "metadata"],
+    "shots": ["project", "sequence", "status", "overlapping", "metadata"],
+    "tasks": ["entity", "status", "assignee", "metadata"],
+    "versions": ["task", "status", "created_by", "metadata"],
+    "project_tasks": ["status", "assignee", "metadata"],
+}
+
+_INCLUDE = {
+    "assets": ("tasks", "tasks.versions"),
+    "shots": ("tasks", "tasks.versions"),
+    "tasks": ("versions",),
+}
+
+
+def _cases(entities):
+    return [
+        pytest.param(entity, names, id=f"{entity}-{'-'.join(names) or 'all'}")
+        for entity in entities
+        for n in range(len(_FILTERS[entity]) + 1)
+        for names in itertools.combinations(_FILTERS[entity], n)
+    ]
+
+
+def _plan(studio, call):
+    """Run call and return the EXPLAIN QUERY PLAN steps of every SELECT it sent."""
+    records = studio.instrumentation.records
+    records.clear()
+    call()
+    steps = []
+    for record in records:
+        for statement in record.statements:
+            if statement.lstrip().upper().startswith("SELECT"):
+                steps += studio.explain(statement, [None] * statement.count("?"))
+    return steps
+
+
+def _table_scans(steps):
+    # R*Tree and FTS5 lookups show up as "SCAN <vtab> VIRTUAL TABLE INDEX ...".
+    return [s for s in steps if s.startswith("SCAN") and "VIRTUAL TABLE" not in s]
+
+
+@pytest.mark.parametrize("entity, names", _cases(_FILTERS))
+def test_find_pages_use_indexes(studio, values, entity, names):
+    kwargs = {name: values[entity][name] for name in names}
+    find = getattr(studio, f"find_{entity}")
+    if entity == "project_tasks":
+        kwargs["project"] = "PLANS"
+    steps = _plan(studio, lambda: find(**kwargs, limit=10, after=1))
+    assert _table_scans(steps) == [], steps
+    assert not [s for s in steps if "TEMP B-TREE" in s], steps
+
+    for include in _INCLUDE.get(entity, ()):
+        steps = _plan(studio, lambda: find(**kwargs, limit=10, after=0, include=[include]))
+        assert _table_scans(steps) == [], steps
+
+
+@pytest.mark.parametrize("entity, names", _cases([e for e in _FILTERS if e != "project_tasks"]))
+def test_counts_use_indexes(studio, values, entity, names):
+    kwargs = {name: values[entity][name] for name in names}
+    steps = _plan(studio, lambda: getattr(studio, f"count_{entity}")(**kwargs))
+    assert _table_scans(steps) == [], steps
@@ -0,0 +1,240 @@
+"""The trigger-maintained status_rollup agrees with the rows it summarizes."""
+
+import sqlite3
+from collections import Counter
+
+import pytest
+from opengrid import Studio
+
+# The schema as it stood before any derived tables, triggers or
+# tasks.project_id existed.
+BASELINE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    code TEXT UNIQUE NOT NULL,
+    status TEXT DEFAULT 'active',
+    description TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    asset_type TEXT NOT NULL,
+    status TEXT DEFAULT 'waiting',
+    description TEXT,
+    thumbnail TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    FOREIGN KEY (project_id) REFERENCES projects(id),
+    UNIQUE (project_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS shots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL,
+    sequence TEXT NOT NULL,
+    name TEXT NOT NULL,
+    frame_start INTEGER DEFAULT 1001,
+    frame_end INTEGER DEFAULT 1100,
+    status TEXT DEFAULT 'waiting',
+    description TEXT,
+    thumbnail TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    FOREIGN KEY (project_id) REFERENCES projects(id),
+    UNIQUE (project_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity_type TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT DEFAULT 'waiting',
+    assignee TEXT,
+    due_date TEXT,
+    priority INTEGER DEFAULT 50,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    UNIQUE (entity_type, entity_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL,
+    version_number INTEGER NOT NULL,
+    status TEXT DEFAULT 'pending_review',
+    path TEXT,
+    thumbnail TEXT,
+    notes TEXT,
+    created_by TEXT,
+    created_at TEXT,
+    metadata TEXT DEFAULT '{}',
+    FOREIGN KEY (task_id) REFERENCES tasks(id),
+    UNIQUE (task_id, version_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_assets_project ON assets(project_id);
+CREATE INDEX IF NOT EXISTS idx_shots_project ON shots(project_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_entity ON tasks(entity_type, entity_id);
+CREATE INDEX IF NOT EXISTS idx_versions_task ON versions(task_id);
+"""
+
+
+@pytest.fixture
+def studio(tmp_path):
+    studio = Studio(tmp_path / "studio.db")
+    yield studio
+    studio.close()
+
+
+def _counted(studio, project):
+    """status_summary() recomputed from the rows returned by find_*."""
+    counts = Counter()
+    assets = studio.find_assets(project)
+    shots = studio.find_shots(project)
+    for asset in assets:
+        counts["asset", asset.asset_type, asset.status or ""] += 1
+    for shot in shots:
+        counts["shot", shot.sequence, shot.status or ""] += 1
+    for entity in assets + shots:
+        for task in studio.find_tasks(entity=entity):
+            counts["task", task.name, task.status or ""] += 1
+    summary = {"asset": {}, "shot": {}, "task": {}}
+    for (entity_type, category, status), count in counts.items():
+        summary[entity_type].setdefault(category, {})[status] = count
+    return summary
+
+
+def _execute(studio, sql, *params):
+    """Write with SQL the Studio API has no method for; triggers still fire."""
+    with studio._pool.write() as conn:
+        conn.execute(sql, params)
+
+
+def _check(studio, *projects):
+    for project in projects:
+        assert studio.status_summary(project) == _counted(studio, project)
+
+
+def test_rollup_follows_inserts_updates_and_deletes(studio):
+    film = studio.create_project("Film", "FILM")
+    promo = studio.create_project("Promo", "PROMO")
+    hero = studio.create_asset(film, "hero", "character")
+    props = studio.create_assets_bulk(
+        film, [{"name": f"prop{i}", "asset_type": "prop"} for i in range(4)]
+    )
+    logo = studio.create_asset(promo, "logo", "graphic", status="approved")
+    shots = studio.create_shots_bulk(
+        film, [{"sequence": "SQ010" if i < 3 else "SQ020", "name": f"sh{i}"} for i in range(5)]
+    )
+    model = studio.create_task(hero, "model")
+    studio.create_tasks_bulk(
+        [{"entity": prop, "name": "model"} for prop in props]
+        + [{"entity": shot, "name": "anim", "status": "in_progress"} for shot in shots]
+        + [{"entity": logo, "name": "design"}]
+    )
+    _check(studio, film, promo)
+    assert studio.status_summary(film)["task"] == {
+        "model": {"waiting": 5}, "anim": {"in_progress": 5},
+    }
+
+    studio.update_task(model, status="approved")
+    studio.update_shot(shots[0], status="final")
+    _check(studio, film, promo)
+
+    _execute(studio, "UPDATE tasks SET name = 'sculpt' WHERE id = ?", model.id)
+    _execute(studio, "UPDATE tasks SET name = 'layout', status = NULL WHERE entity_id = ?"
+             " AND entity_type = 'shot'", shots[1].id)
+    _execute(studio, "UPDATE assets SET asset_type = 'set', status = 'review' WHERE id = ?",
+             props[0].id)
+    _execute(studio, "UPDATE shots SET sequence = 'SQ030' WHERE id = ?", shots[4].id)
+    _check(studio, film, promo)
+    assert studio.status_summary(film)["task"]["layout"] == {"": 1}
+
+    _execute(studio, "UPDATE tasks SET entity_type = 'asset', entity_id = ? WHERE name = 'design'",
+             props[1].id)
+    _execute(studio, "DELETE FROM tasks WHERE id = ?", model.id)
+    _execute(studio, "DELETE FROM tasks WHERE entity_type = 'shot' AND entity_id = ?",
+             shots[2].id)
+    _execute(studio, "DELETE FROM shots WHERE id = ?", shots[2].id)
+    _check(studio, film, promo)
+    assert studio.status_summary(promo) == {"asset": {"graphic": {"approved": 1}},
+                                            "shot": {}, "task": {}}
+
+
+def test_rolled_back_writes_leave_the_rollup_alone(studio):
+    film = studio.create_project("Film", "FILM")
+    hero = studio.create_asset(film, "hero", "character")
+    studio.create_task(hero, "model")
+    before = studio.status_summary(film)
+
+    with pytest.raises(RuntimeError):
+        with studio.transaction():
+            studio.create_task(hero, "rig")
+            studio.create_asset(film, "villain", "character")
+            raise RuntimeError
+    assert studio.status_summary(film) == before == _counted(studio, film)
+
+
+def test_existing_database_is_backfilled(tmp_path):
+    path = tmp_path / "studio.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executescript("""
+        INSERT INTO projects (id, name, code) VALUES (1, 'Film', 'FILM'), (2, 'Promo', 'PROMO');
+        INSERT INTO assets (id, project_id, name, asset_type, description) VALUES
+            (1, 1, 'hero', 'character', 'the lead'),
+            (2, 1, 'crate', 'prop', NULL),
+            (3, 2, 'logo', 'graphic', NULL);
+        INSERT INTO shots (id, project_id, sequence, name, frame_start, frame_end) VALUES
+            (1, 1, 'SQ010', 'sh010', 1001, 1050),
+            (2, 1, 'SQ010', 'sh020', 1051, 1100);
+        INSERT INTO tasks (id, entity_type, entity_id, name, status) VALUES
+            (1, 'asset', 1, 'model', 'approved'),
+            (2, 'asset', 2, 'model', 'waiting'),
+            (3, 'shot', 1, 'anim', 'waiting'),
+            (4, 'asset', 3, 'design', 'waiting');
+        INSERT INTO versions (id, task_id, version_number, path) VALUES
+            (1, 1, 1, '/hero/v001.ma'), (2, 1, 2, '/hero/v002.ma');
+    """)
+    conn.commit()
+    conn.close()
+
+    studio = Studio(path)
+    try:
+        _check(studio, "FILM", "PROMO")
+        assert studio.status_summary("FILM")["task"] == {
+            "model": {"approved": 1, "waiting": 1}, "anim": {"waiting": 1},
+        }
+        assert studio.count_projects() == 2
+        assert studio.count_assets() == 3
+        assert studio.count_tasks() == 4
+        assert studio.count_versions() == 2
+        assert [t.id for _, t in studio.find_project_tasks("FILM")] == [1, 2, 3]
+        assert [t.id for _, t in studio.find_project_tasks("PROMO")] == [4]
+        assert [s.name for s in studio.find_shots("FILM", overlapping=(1060, 1070))] == ["sh020"]
+        assert {e.name for e in studio.search("lead")} == {"hero"}
+
+        # Triggers keep the backfilled tables current from here on.
+        studio.update_task(2, status="approved")
+        studio.create_task(studio.get_shot("FILM", "sh020"), "anim")
+        _check(studio, "FILM", "PROMO")
+        assert [t.id for _, t in studio.find_project_tasks("FILM")] == [1, 2, 3, 5]
+        assert [(c.entity_type, c.op) for c in studio.changes_since()] == [
+            ("task", "update"), ("task", "insert"),
+        ]
+    finally:
+        studio.close()
+
+    # Reopening does not run the backfill twice.
+    studio = Studio(path)
+    try:
+        _check(studio, "FILM", "PROMO")
+        assert studio.count_tasks() == 5
+    finally:
+        studio.close()
@@ -0,0 +1,107 @@
+"""Studio.transaction() and the pool's write/savepoint/after_commit handling."""
+
+import threading
+
+import pytest
+from opengrid import Studio
+
+
+class Boom(Exception):
+    pass
+
+
+@pytest.fixture
+def studio(tmp_path):
+    studio = Studio(tmp_path / "studio.db", cache_size=100)
+    yield studio
+    studio.close()
+
+
+def _in_thread(func):
+    """Call func on another thread, which reads through its own connection."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def _cached_codes(studio):
+    return {code for code in ("A", "B", "C") if studio._cache.get(("project", code))}
+
+
+def test_commit_on_exit(studio):
+    with studio.transaction():
+        project = studio.create_project("A", "A")
+        studio.create_asset(project, "hero", "character")
+        # Uncommitted: invisible to other threads and not cached yet.
+        assert _in_thread(studio.count_projects) == 0
+        assert _cached_codes(studio) == set()
+
+    assert _in_thread(studio.count_projects) == 1
+    assert _in_thread(lambda: studio.count_assets("A")) == 1
+    assert _cached_codes(studio) == {"A"}
+    assert studio._project_ids == {"A": project.id}
+
+
+def test_rollback_on_error(studio):
+    with pytest.raises(Boom):
+        with studio.transaction():
+            project = studio.create_project("A", "A")
+            studio.create_asset(project, "hero", "character")
+            raise Boom
+
+    assert studio.count_projects() == 0
+    assert studio.count_assets() == 0
+    assert studio.get_project("A") is None
+    assert _cached_codes(studio) == set()
+    assert studio._project_ids == {}
+
+
+def test_inner_block_rolls_back_alone(studio):
+    with studio.transaction():
+        studio.create_project("A", "A")
+        with pytest.raises(Boom):
+            with studio.transaction():
+                studio.create_project("B", "B")
+                raise Boom
+        studio.create_project("C", "C")
+
+    assert [p.code for p in studio.find_projects()] == ["A", "C"]
+    assert studio.count_projects() == 2
+    assert _cached_codes(studio) == {"A", "C"}
+    assert set(studio._project_ids) == {"A", "C"}
+    assert studio.get_project("B") is None
+
+
+def test_after_commit_waits_for_the_outermost_commit(studio):
+    pool = studio._pool
+    calls = []
+    with pool.write():
+        pool.after_commit(lambda: calls.append("outer"))
+        with pool.write():
+            pool.after_commit(lambda: calls.append("inner"))
+        assert calls == []
+    assert calls == ["outer", "inner"]
+
+    pool.after_commit(lambda: calls.append("now"))
+    assert calls == ["outer", "inner", "now"]
+
+
+def test_after_commit_is_dropped_on_rollback(studio):
+    pool = studio._pool
+    calls = []
+    with pool.write():
+        pool.after_commit(lambda: calls.append("kept"))
+        with pytest.raises(Boom):
+            with pool.write():
+                pool.after_commit(lambda: calls.append("inner"))
+                raise Boom
+    assert calls == ["kept"]
+
+    with pytest.raises(Boom):
+        with pool.write():
+            pool.after_commit(lambda: calls.append("outer"))
+            raise Boom
+    assert calls == ["kept"]
+    assert not pool.writing
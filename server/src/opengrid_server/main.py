@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, AsyncIterator, Optional
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
-from opengrid import Studio, Project, Asset, Shot, Task, Version
+from opengrid import AsyncStudio, Project, Asset, Shot, Task, Version, Change
+
+logger = logging.getLogger("opengrid")
 
 
 class Settings(BaseSettings):
@@ -23,6 +30,9 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
+    database_threads: int = 16
+    slow_query_ms: Optional[float] = None
+    events_poll_interval: float = 0.5
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:5173"]
     
     class Config:
@@ -32,16 +42,18 @@ class Settings(BaseSettings):
 settings = Settings()
 
 # Global studio instance
-_studio: Optional[Studio] = None
+_studio: Optional[AsyncStudio] = None
 
 
-def get_studio() -> Studio:
+def get_studio() -> AsyncStudio:
     """Get the studio instance."""
     global _studio
     if _studio is None:
         db_path = Path(settings.database_path).expanduser()
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        _studio = Studio(db_path)
+        _studio = AsyncStudio(db_path, max_workers=settings.database_threads)
+        if settings.slow_query_ms is not None or settings.debug:
+            _studio.studio.enable_instrumentation(slow_ms=settings.slow_query_ms)
     return _studio
 
 
@@ -49,11 +61,12 @@ def get_studio() -> Studio:
 async def lifespan(app: FastAPI):
     """Startup/shutdown lifecycle."""
     # Startup
-    get_studio()
+    await events.start(get_studio())
     yield
     # Shutdown
+    await events.stop()
     if _studio:
-        _studio.close()
+        await _studio.close()
 
 
 app = FastAPI(
@@ -63,13 +76,66 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS for web frontend
+# GET routes whose body is not a pure function of the database contents.
+# /api/changes also shrinks when the feed is pruned, which does not advance
+# the sequence the tags are built from.
+_UNCACHED_PATHS = {
+    "/api/health",
+    "/api/events",
+    "/api/ws",
+    "/api/changes",
+    "/api/debug/queries",
+}
+
+
+def entity_tag(seq: int, request: Request) -> str:
+    """Strong ETag for this URL as of change `seq`."""
+    key = f"{seq} {request.url.path}?{request.url.query}".encode()
+    return f'"{hashlib.blake2b(key, digest_size=12).hexdigest()}"'
+
+
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    """Strong ETags from the change feed, with 304s for unchanged data.
+    
+    Every write appends to the change feed, so the newest sequence number
+    identifies the state of the whole database. Hashed together with the
+    path and query it names one response, so a matching If-None-Match is
+    answered with 304 after that one lookup, without running the route.
+    Only 200 responses carry a tag, so a URL that would 404 never matches.
+    The sequence is read before the route runs, so a write racing with it
+    can only make the tag older, never newer.
+    """
+    if (
+        request.method not in ("GET", "HEAD")
+        or not request.url.path.startswith("/api/")
+        or request.url.path in _UNCACHED_PATHS
+    ):
+        return await call_next(request)
+    
+    etag = entity_tag(await get_studio().last_change(), request)
+    # Let browsers keep the body but revalidate it on every use.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags:
+            return Response(status_code=304, headers=headers)
+    
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
+
+
+# CORS for web frontend (added last so it also wraps the 304 responses)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Link", "ETag"],
 )
 
 
@@ -113,6 +179,36 @@ class AssetResponse(BaseModel):
         from_attributes = True
 
 
+class ShotCreate(BaseModel):
+    sequence: str
+    name: str
+    frame_start: int = 1001
+    frame_end: int = 1100
+    description: Optional[str] = None
+
+
+class ShotUpdate(BaseModel):
+    status: Optional[str] = None
+    frame_start: Optional[int] = None
+    frame_end: Optional[int] = None
+    description: Optional[str] = None
+
+
+class ShotResponse(BaseModel):
+    id: int
+    project_id: int
+    sequence: str
+    name: str
+    frame_start: int
+    frame_end: int
+    status: str
+    description: Optional[str]
+    thumbnail: Optional[str]
+    
+    class Config:
+        from_attributes = True
+
+
 class TaskCreate(BaseModel):
     name: str
     assignee: Optional[str] = None
@@ -138,6 +234,10 @@ class TaskResponse(BaseModel):
         from_attributes = True
 
 
+class ProjectTaskResponse(TaskResponse):
+    entity_name: str
+
+
 class VersionCreate(BaseModel):
     path: Optional[str] = None
     notes: Optional[str] = None
@@ -157,24 +257,167 @@ class VersionResponse(BaseModel):
         from_attributes = True
 
 
+class ChangeResponse(BaseModel):
+    seq: int
+    entity_type: str
+    entity_id: int
+    op: str
+    project_id: Optional[int]
+    
+    class Config:
+        from_attributes = True
+
+
+class SearchResult(BaseModel):
+    entity_type: str  # "asset", "shot", "task" or "version"
+    id: int
+    name: str
+    status: str
+    description: Optional[str]
+
+
+# =============================================================================
+# Pagination
+# =============================================================================
+
+# List routes return at most this many items unless asked for fewer, and
+# link to the next page with a Link header.
+DEFAULT_PAGE_SIZE = 1000
+
+PageLimit = Annotated[
+    int,
+    Query(ge=1, le=1000, description="Maximum number of items to return"),
+]
+PageAfter = Annotated[
+    Optional[int],
+    Query(description="Return items with an ID greater than this"),
+]
+
+
+def set_next_link(request: Request, response: Response, items: list, limit: int) -> None:
+    """Point a `Link: rel="next"` header at the following page if this one is full."""
+    if len(items) == limit:
+        next_url = request.url.include_query_params(after=items[-1].id)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+
+# =============================================================================
+# Change events
+# =============================================================================
+
+class Subscriber:
+    """One open event stream and the project it is filtered to."""
+    
+    __slots__ = ("queue", "project_id")
+    
+    QUEUE_SIZE = 1000
+    
+    def __init__(self, project_id: Optional[int]) -> None:
+        # None in the queue means the subscriber fell too far behind.
+        self.queue: asyncio.Queue[Optional[Change]] = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self.project_id = project_id
+
+
+class ChangeHub:
+    """Fans the Studio change feed out to every open event stream.
+    
+    A single background task polls `changes_since` and copies each entry
+    into the queue of every matching subscriber, so the database sees one
+    query per interval however many clients are connected. A subscriber
+    whose queue fills up is dropped and told to resync.
+    """
+    
+    PAGE_SIZE = 1000
+    
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.last_seq = 0
+        self._subscribers: set[Subscriber] = set()
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self, studio: AsyncStudio) -> None:
+        self.last_seq = await studio.last_change()
+        self._task = asyncio.create_task(self._poll(studio))
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def subscribe(self, project_id: Optional[int]) -> Subscriber:
+        subscriber = Subscriber(project_id)
+        self._subscribers.add(subscriber)
+        return subscriber
+    
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+    
+    async def _poll(self, studio: AsyncStudio) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                if not self._subscribers:
+                    self.last_seq = await studio.last_change()
+                    continue
+                # Drain the backlog before sleeping again, so a burst of
+                # writes reaches clients in one tick rather than 1000 per tick.
+                while True:
+                    changes = await studio.changes_since(self.last_seq, limit=self.PAGE_SIZE)
+                    for change in changes:
+                        self._publish(change)
+                    if changes:
+                        self.last_seq = changes[-1].seq
+                    if len(changes) < self.PAGE_SIZE:
+                        break
+            except Exception:
+                # Keep polling: a busy database usually recovers by next tick.
+                logger.exception("Polling the change feed failed")
+    
+    def _publish(self, change: Change) -> None:
+        for subscriber in list(self._subscribers):
+            if subscriber.project_id is not None and subscriber.project_id != change.project_id:
+                continue
+            try:
+                subscriber.queue.put_nowait(change)
+            except asyncio.QueueFull:
+                self.unsubscribe(subscriber)
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+                subscriber.queue.put_nowait(None)
+
+
+events = ChangeHub(settings.events_poll_interval)
+
+
 # =============================================================================
 # Routes — Projects
 # =============================================================================
 
 @app.get("/api/projects", response_model=list[ProjectResponse])
-def list_projects(status: Optional[str] = None):
+async def list_projects(
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageAfter = None,
+):
     """List all projects."""
     studio = get_studio()
-    projects = studio.find_projects(status=status)
+    projects = await studio.find_projects(status=status, limit=limit, after=after)
+    set_next_link(request, response, projects, limit)
     return [ProjectResponse.model_validate(p) for p in projects]
 
 
 @app.post("/api/projects", response_model=ProjectResponse, status_code=201)
-def create_project(data: ProjectCreate):
+async def create_project(data: ProjectCreate):
     """Create a new project."""
     studio = get_studio()
     try:
-        project = studio.create_project(
+        project = await studio.create_project(
             name=data.name,
             code=data.code,
             description=data.description,
@@ -185,91 +428,261 @@ def create_project(data: ProjectCreate):
 
 
 @app.get("/api/projects/{code}", response_model=ProjectResponse)
-def get_project(code: str):
+async def get_project(code: str):
     """Get a project by code."""
     studio = get_studio()
-    project = studio.get_project(code)
+    project = await studio.get_project(code)
     if not project:
         raise HTTPException(404, f"Project not found: {code}")
     return ProjectResponse.model_validate(project)
 
 
+@app.get("/api/projects/{code}/summary")
+async def project_summary(code: str) -> dict[str, dict[str, dict[str, int]]]:
+    """Asset, shot and task counts by category and status."""
+    studio = get_studio()
+    try:
+        return await studio.status_summary(code)
+    except ValueError:
+        raise HTTPException(404, f"Project not found: {code}")
+
+
 # =============================================================================
 # Routes — Assets
 # =============================================================================
 
 @app.get("/api/projects/{code}/assets", response_model=list[AssetResponse])
-def list_assets(
+async def list_assets(
+    request: Request,
+    response: Response,
     code: str,
     asset_type: Optional[str] = None,
     status: Optional[str] = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageAfter = None,
 ):
     """List assets in a project."""
     studio = get_studio()
-    project = studio.get_project(code)
-    if not project:
+    try:
+        assets = await studio.find_assets(
+            project=code,
+            asset_type=asset_type,
+            status=status,
+            limit=limit,
+            after=after,
+        )
+    except ValueError:
         raise HTTPException(404, f"Project not found: {code}")
-    
-    assets = studio.find_assets(project=project, asset_type=asset_type, status=status)
+    set_next_link(request, response, assets, limit)
     return [AssetResponse.model_validate(a) for a in assets]
 
 
 @app.post("/api/projects/{code}/assets", response_model=AssetResponse, status_code=201)
-def create_asset(code: str, data: AssetCreate):
+async def create_asset(code: str, data: AssetCreate):
     """Create an asset in a project."""
     studio = get_studio()
-    project = studio.get_project(code)
-    if not project:
-        raise HTTPException(404, f"Project not found: {code}")
-    
     try:
-        asset = studio.create_asset(
-            project=project,
+        asset = await studio.create_asset(
+            project=code,
             name=data.name,
             asset_type=data.asset_type,
             description=data.description,
         )
         return AssetResponse.model_validate(asset)
+    except ValueError:
+        raise HTTPException(404, f"Project not found: {code}")
     except Exception as e:
         raise HTTPException(400, str(e))
 
 
 @app.get("/api/projects/{code}/assets/{name}", response_model=AssetResponse)
-def get_asset(code: str, name: str):
+async def get_asset(code: str, name: str):
     """Get an asset by name."""
     studio = get_studio()
-    project = studio.get_project(code)
-    if not project:
+    try:
+        asset = await studio.get_asset(code, name)
+    except ValueError:
         raise HTTPException(404, f"Project not found: {code}")
-    
-    asset = studio.get_asset(project, name)
     if not asset:
         raise HTTPException(404, f"Asset not found: {name}")
     return AssetResponse.model_validate(asset)
 
 
+# =============================================================================
+# Routes — Shots
+# =============================================================================
+
+@app.get("/api/projects/{code}/shots", response_model=list[ShotResponse])
+async def list_shots(
+    request: Request,
+    response: Response,
+    code: str,
+    sequence: Optional[str] = None,
+    status: Optional[str] = None,
+    frame_start: Annotated[
+        Optional[int], Query(description="Only shots that overlap frames from here on")
+    ] = None,
+    frame_end: Annotated[
+        Optional[int], Query(description="Only shots that overlap frames up to here")
+    ] = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageAfter = None,
+):
+    """List shots in a project."""
+    studio = get_studio()
+    overlapping = None
+    if frame_start is not None or frame_end is not None:
+        overlapping = (
+            -(2**31) if frame_start is None else frame_start,
+            2**31 - 1 if frame_end is None else frame_end,
+        )
+    try:
+        shots = await studio.find_shots(
+            project=code,
+            sequence=sequence,
+            status=status,
+            overlapping=overlapping,
+            limit=limit,
+            after=after,
+        )
+    except ValueError:
+        raise HTTPException(404, f"Project not found: {code}")
+    set_next_link(request, response, shots, limit)
+    return [ShotResponse.model_validate(s) for s in shots]
+
+
+@app.post("/api/projects/{code}/shots", response_model=ShotResponse, status_code=201)
+async def create_shot(code: str, data: ShotCreate):
+    """Create a shot in a project."""
+    studio = get_studio()
+    if await studio.get_project(code) is None:
+        raise HTTPException(404, f"Project not found: {code}")
+    try:
+        shot = await studio.create_shot(
+            project=code,
+            sequence=data.sequence,
+            name=data.name,
+            frame_start=data.frame_start,
+            frame_end=data.frame_end,
+            description=data.description,
+        )
+        return ShotResponse.model_validate(shot)
+    except Exception as e:
+        raise HTTPException(400, str(e))
+
+
+@app.get("/api/projects/{code}/shots/{name}", response_model=ShotResponse)
+async def get_shot(code: str, name: str):
+    """Get a shot by name."""
+    studio = get_studio()
+    try:
+        shot = await studio.get_shot(code, name)
+    except ValueError:
+        raise HTTPException(404, f"Project not found: {code}")
+    if not shot:
+        raise HTTPException(404, f"Shot not found: {name}")
+    return ShotResponse.model_validate(shot)
+
+
+@app.patch("/api/shots/{shot_id}", response_model=ShotResponse)
+async def update_shot(shot_id: int, data: ShotUpdate):
+    """Update a shot."""
+    studio = get_studio()
+    
+    try:
+        shot = await studio.update_shot(
+            shot=shot_id,
+            status=data.status,
+            frame_start=data.frame_start,
+            frame_end=data.frame_end,
+            description=data.description,
+        )
+    except Exception as e:
+        raise HTTPException(400, str(e))
+    if not shot:
+        raise HTTPException(404, f"Shot not found: {shot_id}")
+    return ShotResponse.model_validate(shot)
+
+
 # =============================================================================
 # Routes — Tasks
 # =============================================================================
 
 @app.get("/api/assets/{asset_id}/tasks", response_model=list[TaskResponse])
-def list_asset_tasks(asset_id: int):
+async def list_asset_tasks(
+    request: Request,
+    response: Response,
+    asset_id: int,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageAfter = None,
+):
     """List tasks on an asset."""
     studio = get_studio()
     # Create a minimal asset for the query
     asset = Asset(id=asset_id, project_id=0, name="", asset_type="")
-    tasks = studio.find_tasks(entity=asset)
+    tasks = await studio.find_tasks(entity=asset, limit=limit, after=after)
+    set_next_link(request, response, tasks, limit)
+    return [TaskResponse.model_validate(t) for t in tasks]
+
+
+@app.get("/api/shots/{shot_id}/tasks", response_model=list[TaskResponse])
+async def list_shot_tasks(
+    request: Request,
+    response: Response,
+    shot_id: int,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageAfter = None,
+):
+    """List tasks on a shot."""
+    studio = get_studio()
+    # Create a minimal shot for the query
+    shot = Shot(id=shot_id, project_id=0, sequence="", name="")
+    tasks = await studio.find_tasks(entity=shot, limit=limit, after=after)
+    set_next_link(request, response, tasks, limit)
     return [TaskResponse.model_validate(t) for t in tasks]
 
 
+@app.get("/api/projects/{code}/tasks", response_model=list[ProjectTaskResponse])
+async def list_project_tasks(
+    request: Request,
+    response: Response,
+    code: str,
+    status: Optional[str] = None,
+    assignee: Optional[str] = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageAfter = None,
+):
+    """List tasks on every asset and shot in a project."""
+    studio = get_studio()
+    try:
+        rows = await studio.find_project_tasks(
+            code,
+            status=status,
+            assignee=assignee,
+            limit=limit,
+            after=after,
+        )
+    except ValueError:
+        raise HTTPException(404, f"Project not found: {code}")
+    tasks = [task for _, task in rows]
+    set_next_link(request, response, tasks, limit)
+    return [
+        ProjectTaskResponse(
+            **TaskResponse.model_validate(task).model_dump(),
+            entity_name=entity_name,
+        )
+        for entity_name, task in rows
+    ]
+
+
 @app.post("/api/assets/{asset_id}/tasks", response_model=TaskResponse, status_code=201)
-def create_asset_task(asset_id: int, data: TaskCreate):
+async def create_asset_task(asset_id: int, data: TaskCreate):
     """Create a task on an asset."""
     studio = get_studio()
     asset = Asset(id=asset_id, project_id=0, name="", asset_type="")
     
     try:
-        task = studio.create_task(
+        task = await studio.create_task(
             entity=asset,
             name=data.name,
             assignee=data.assignee,
@@ -280,25 +693,51 @@ def create_asset_task(asset_id: int, data: TaskCreate):
         raise HTTPException(400, str(e))
 
 
+@app.post("/api/shots/{shot_id}/tasks", response_model=TaskResponse, status_code=201)
+async def create_shot_task(shot_id: int, data: TaskCreate):
+    """Create a task on a shot."""
+    studio = get_studio()
+    shot = Shot(id=shot_id, project_id=0, sequence="", name="")
+    
+    try:
+        task = await studio.create_task(
+            entity=shot,
+            name=data.name,
+            assignee=data.assignee,
+            priority=data.priority,
+        )
+        return TaskResponse.model_validate(task)
+    except Exception as e:
+        raise HTTPException(400, str(e))
+
+
+@app.get("/api/tasks/{task_id}", response_model=TaskResponse)
+async def get_task(task_id: int):
+    """Get a task by ID."""
+    studio = get_studio()
+    task = await studio.get_task(task_id)
+    if not task:
+        raise HTTPException(404, f"Task not found: {task_id}")
+    return TaskResponse.model_validate(task)
+
+
 @app.patch("/api/tasks/{task_id}", response_model=TaskResponse)
-def update_task(task_id: int, data: TaskUpdate):
+async def update_task(task_id: int, data: TaskUpdate):
     """Update a task."""
     studio = get_studio()
     
     try:
-        studio.update_task(
+        task = await studio.update_task(
             task=task_id,
             status=data.status,
             assignee=data.assignee,
             priority=data.priority,
         )
-        # Fetch updated task
-        tasks = [t for t in studio.find_tasks() if t.id == task_id]
-        if not tasks:
-            raise HTTPException(404, f"Task not found: {task_id}")
-        return TaskResponse.model_validate(tasks[0])
     except Exception as e:
         raise HTTPException(400, str(e))
+    if not task:
+        raise HTTPException(404, f"Task not found: {task_id}")
+    return TaskResponse.model_validate(task)
 
 
 # =============================================================================
@@ -306,12 +745,12 @@ def update_task(task_id: int, data: TaskUpdate):
 # =============================================================================
 
 @app.post("/api/tasks/{task_id}/versions", response_model=VersionResponse, status_code=201)
-def create_version(task_id: int, data: VersionCreate):
+async def create_version(task_id: int, data: VersionCreate):
     """Create a new version."""
     studio = get_studio()
     
     try:
-        version = studio.create_version(
+        version = await studio.create_version(
             task=task_id,
             path=data.path,
             notes=data.notes,
@@ -322,27 +761,243 @@ def create_version(task_id: int, data: VersionCreate):
         raise HTTPException(400, str(e))
 
 
+@app.get("/api/versions/{version_id}", response_model=VersionResponse)
+async def get_version(version_id: int):
+    """Get a version by ID."""
+    studio = get_studio()
+    version = await studio.get_version(version_id)
+    if not version:
+        raise HTTPException(404, f"Version not found: {version_id}")
+    return VersionResponse.model_validate(version)
+
+
+# =============================================================================
+# Routes — Change feed
+# =============================================================================
+
+@app.get("/api/changes", response_model=list[ChangeResponse])
+async def list_changes(
+    request: Request,
+    response: Response,
+    since: Annotated[int, Query(ge=0, description="Last sequence number already seen")] = 0,
+    limit: Annotated[int, Query(ge=1, le=10000)] = 1000,
+    project: Optional[str] = None,
+):
+    """Entities written after `since`, oldest first, for incremental sync."""
+    studio = get_studio()
+    try:
+        changes = await studio.changes_since(since, limit=limit, project=project)
+    except ValueError:
+        raise HTTPException(404, f"Project not found: {project}")
+    if len(changes) == limit:
+        next_url = request.url.include_query_params(since=changes[-1].seq)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return [ChangeResponse.model_validate(c) for c in changes]
+
+
+async def follow_changes(
+    project_id: Optional[int],
+    since: Optional[int],
+) -> AsyncIterator[tuple[str, Optional[Change]]]:
+    """Yield ("change", entry), ("ping", None) or a final ("resync", None).
+    
+    With `since`, entries after it are replayed from the feed first; live
+    entries already replayed are skipped.
+    """
+    studio = get_studio()
+    subscriber = events.subscribe(project_id)
+    try:
+        sent = since
+        if since is not None:
+            while True:
+                backlog = await studio.changes_since(sent, limit=1000, project=project_id)
+                for change in backlog:
+                    yield "change", change
+                    sent = change.seq
+                if len(backlog) < 1000:
+                    break
+        while True:
+            try:
+                change = await asyncio.wait_for(subscriber.queue.get(), timeout=15)
+            except asyncio.TimeoutError:
+                yield "ping", None
+                continue
+            if change is None:
+                yield "resync", None
+                return
+            if sent is not None and change.seq <= sent:
+                continue
+            yield "change", change
+            sent = change.seq
+    finally:
+        events.unsubscribe(subscriber)
+
+
+async def resolve_project_filter(project: Optional[str]) -> Optional[int]:
+    if project is None:
+        return None
+    found = await get_studio().get_project(project)
+    if found is None:
+        raise HTTPException(404, f"Project not found: {project}")
+    return found.id
+
+
+def change_payload(change: Change) -> str:
+    return json.dumps(ChangeResponse.model_validate(change).model_dump())
+
+
+@app.get("/api/events")
+async def stream_events(
+    request: Request,
+    project: Optional[str] = None,
+    since: Annotated[
+        Optional[int], Query(ge=0, description="Replay changes after this sequence number")
+    ] = None,
+):
+    """Server-Sent Events stream of the change feed.
+    
+    Each write arrives as an `event: change` whose `id` is its sequence
+    number, so a reconnecting EventSource resumes from `Last-Event-ID`.
+    An `event: resync` means this client fell behind and should refetch.
+    """
+    project_id = await resolve_project_filter(project)
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    
+    async def stream() -> AsyncIterator[str]:
+        async for kind, change in follow_changes(project_id, since):
+            if kind == "change":
+                yield f"id: {change.seq}\nevent: change\ndata: {change_payload(change)}\n\n"
+            elif kind == "ping":
+                yield ": ping\n\n"
+            else:
+                yield "event: resync\ndata: {}\n\n"
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/api/ws")
+async def websocket_events(
+    websocket: WebSocket,
+    project: Optional[str] = None,
+    since: Optional[int] = None,
+):
+    """WebSocket variant of /api/events, one JSON message per change."""
+    studio = get_studio()
+    project_id = None
+    if project is not None:
+        found = await studio.get_project(project)
+        if found is None:
+            await websocket.close(code=4404)
+            return
+        project_id = found.id
+    await websocket.accept()
+    try:
+        async for kind, change in follow_changes(project_id, since):
+            if kind == "change":
+                await websocket.send_json(
+                    {"type": "change", **ChangeResponse.model_validate(change).model_dump()}
+                )
+            else:
+                await websocket.send_json({"type": kind})
+            if kind == "resync":
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        pass
+
+
+# =============================================================================
+# Routes — Search
+# =============================================================================
+
+@app.get("/api/search", response_model=list[SearchResult])
+async def search(
+    q: Annotated[str, Query(min_length=1, description="Words to match, as prefixes")],
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+):
+    """Ranked full-text search over assets, shots, tasks and versions."""
+    results = []
+    for entity in await get_studio().search(q, limit=limit):
+        if isinstance(entity, Version):
+            result = SearchResult(
+                entity_type="version",
+                id=entity.id,
+                name=entity.path or entity.version_string,
+                status=entity.status,
+                description=entity.notes,
+            )
+        elif isinstance(entity, Task):
+            result = SearchResult(
+                entity_type="task",
+                id=entity.id,
+                name=entity.name,
+                status=entity.status,
+                description=entity.assignee,
+            )
+        else:
+            result = SearchResult(
+                entity_type="asset" if isinstance(entity, Asset) else "shot",
+                id=entity.id,
+                name=entity.name,
+                status=entity.status,
+                description=entity.description,
+            )
+        results.append(result)
+    return results
+
+
 # =============================================================================
 # Health & Info
 # =============================================================================
 
 @app.get("/api/health")
-def health():
+async def health():
     """Health check."""
     return {"status": "ok", "version": "0.1.0"}
 
 
 @app.get("/api/stats")
-def stats():
+async def stats():
     """Database statistics."""
     studio = get_studio()
     return {
-        "projects": len(studio.find_projects()),
-        "assets": len(studio.find_assets()),
-        "tasks": len(studio.find_tasks()),
+        "projects": await studio.count_projects(),
+        "assets": await studio.count_assets(),
+        "shots": await studio.count_shots(),
+        "tasks": await studio.count_tasks(),
+        "versions": await studio.count_versions(),
     }
 
 
+@app.get("/api/debug/queries")
+async def debug_queries(slowest: bool = False, limit: PageLimit = 100):
+    """Recent Studio calls with their timings and SQL (debug mode only)."""
+    instrumentation = get_studio().studio.instrumentation
+    if not settings.debug or instrumentation is None:
+        raise HTTPException(404, "Not found")
+    if slowest:
+        records = instrumentation.slowest(limit)
+    else:
+        records = list(instrumentation.records)[-limit:][::-1]
+    return [
+        {
+            "method": r.method,
+            "args": r.args,
+            "elapsed_ms": round(r.elapsed * 1000, 3),
+            "rows": r.rows,
+            "statements": r.statements,
+            "error": r.error,
+        }
+        for r in records
+    ]
+
+
 # =============================================================================
 # CLI
 # =============================================================================
@@ -0,0 +1,52 @@
+import threading
+import time
+
+import httpx
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+from opengrid_server import main
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """The app pointed at a fresh database, with fast change-feed polling."""
+    monkeypatch.setattr(main.settings, "database_path", str(tmp_path / "studio.db"))
+    monkeypatch.setattr(main.events, "interval", 0.02)
+    monkeypatch.setattr(main, "_studio", None)
+    return main.app
+
+
+@pytest.fixture
+def client(app):
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def studio(app):
+    """The synchronous Studio behind the running app, for direct writes."""
+    return main.get_studio().studio
+
+
+@pytest.fixture
+def live_client(app):
+    """An HTTP client for the app served by uvicorn on a background thread.
+
+    TestClient buffers whole responses, so streaming routes such as
+    /api/events need a real server.
+    """
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        assert thread.is_alive() and time.monotonic() < deadline, "server did not start"
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=5) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        thread.join(10)
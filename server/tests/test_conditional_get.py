@@ -0,0 +1,58 @@
+"""ETags and 304 responses from the conditional_get middleware."""
+
+from opengrid_server import main
+
+
+def test_unchanged_get_is_304_without_running_the_route(client, studio, monkeypatch):
+    studio.create_project("Film", "FILM")
+    first = client.get("/api/projects")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("route ran for a 304")
+
+    monkeypatch.setattr(main.get_studio().studio, "find_projects", fail)
+    again = client.get("/api/projects", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.content == b""
+
+
+def test_write_changes_the_tag(client, studio):
+    studio.create_project("Film", "FILM")
+    etag = client.get("/api/projects").headers["etag"]
+    studio.create_project("Other", "OTHER")
+
+    response = client.get("/api/projects", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 2
+
+
+def test_tags_are_per_url(client, studio):
+    studio.create_project("Film", "FILM")
+    etag = client.get("/api/projects").headers["etag"]
+
+    assert client.get("/api/projects?status=active").headers["etag"] != etag
+    missing = client.get("/api/projects/NOPE", headers={"If-None-Match": etag})
+    assert missing.status_code == 404
+    assert "etag" not in missing.headers
+
+
+def test_weak_and_listed_tags_match(client, studio):
+    studio.create_project("Film", "FILM")
+    etag = client.get("/api/projects/FILM").headers["etag"]
+
+    headers = {"If-None-Match": f'"other", W/{etag}'}
+    assert client.get("/api/projects/FILM", headers=headers).status_code == 304
+
+
+def test_change_feed_is_not_tagged(client, studio):
+    studio.create_project("Film", "FILM")
+    response = client.get("/api/changes")
+    assert "etag" not in response.headers
+
+    studio.prune_changes(studio.last_change() + 1)
+    assert client.get("/api/changes").json() == []
@@ -0,0 +1,159 @@
+"""The change feed over /api/events (SSE) and /api/ws."""
+
+import json
+import time
+
+import pytest
+from opengrid_server import main
+from starlette.websockets import WebSocketDisconnect
+
+
+def _sse_events(response):
+    """Parse a text/event-stream body into {field: value} dicts, skipping pings."""
+    event = {}
+    for line in response.iter_lines():
+        if not line:
+            if event:
+                yield event
+            event = {}
+        elif not line.startswith(":"):
+            field, _, value = line.partition(": ")
+            event[field] = value
+
+
+def _wait_for_hub(studio):
+    """Wait until the hub has polled past every existing change."""
+    deadline = time.monotonic() + 5
+    while main.events.last_seq < studio.last_change():
+        assert time.monotonic() < deadline, "hub never caught up"
+        time.sleep(0.01)
+
+
+def _wait_for_subscriber():
+    deadline = time.monotonic() + 5
+    while not main.events._subscribers:
+        assert time.monotonic() < deadline, "stream never subscribed"
+        time.sleep(0.01)
+
+
+def test_sse_replays_since_then_follows_live_writes(live_client, studio):
+    project = studio.create_project("Film", "FILM")  # seq 1
+    studio.create_asset(project, "hero", "character")  # seq 2
+    studio.create_asset(project, "villain", "character")  # seq 3
+
+    with live_client.stream("GET", "/api/events", params={"since": 1}) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _sse_events(response)
+        replayed = [next(events), next(events)]
+        assert [e["id"] for e in replayed] == ["2", "3"]
+        assert [e["event"] for e in replayed] == ["change", "change"]
+        assert json.loads(replayed[0]["data"]) == {
+            "seq": 2,
+            "entity_type": "asset",
+            "entity_id": 1,
+            "op": "insert",
+            "project_id": project.id,
+        }
+
+        studio.create_asset(project, "prop", "prop")
+        assert next(events)["id"] == "4"
+
+
+def test_sse_resumes_after_last_event_id(live_client, studio):
+    project = studio.create_project("Film", "FILM")
+    for name in ("a", "b", "c"):
+        studio.create_asset(project, name, "prop")
+
+    headers = {"Last-Event-ID": "2"}
+    with live_client.stream("GET", "/api/events", headers=headers) as response:
+        events = _sse_events(response)
+        assert [next(events)["id"], next(events)["id"]] == ["3", "4"]
+
+
+def test_sse_project_filter(live_client, studio):
+    film = studio.create_project("Film", "FILM")  # seq 1
+    other = studio.create_project("Other", "OTHER")  # seq 2
+
+    with live_client.stream(
+        "GET", "/api/events", params={"project": "FILM", "since": 0}
+    ) as response:
+        events = _sse_events(response)
+        assert next(events)["id"] == "1"
+        studio.create_asset(other, "skipped", "prop")  # seq 3
+        studio.create_asset(film, "kept", "prop")  # seq 4
+        event = next(events)
+        assert event["id"] == "4"
+        assert json.loads(event["data"])["project_id"] == film.id
+
+
+def test_sse_unknown_project_is_404(live_client):
+    assert live_client.get("/api/events", params={"project": "NOPE"}).status_code == 404
+
+
+def test_sse_resync_when_queue_overflows(live_client, studio, monkeypatch):
+    monkeypatch.setattr(main.Subscriber, "QUEUE_SIZE", 5)
+    project = studio.create_project("Film", "FILM")
+    _wait_for_hub(studio)
+
+    with live_client.stream("GET", "/api/events") as response:
+        events = _sse_events(response)
+        _wait_for_subscriber()
+        # One transaction, so the hub publishes all of it in a single page.
+        studio.create_assets_bulk(
+            project, [{"name": f"a{i}", "asset_type": "prop"} for i in range(20)]
+        )
+        assert next(events) == {"event": "resync", "data": "{}"}
+        assert list(events) == []
+    assert not main.events._subscribers
+
+
+def test_websocket_replays_since_then_follows_live_writes(client, studio):
+    project = studio.create_project("Film", "FILM")
+    studio.create_asset(project, "hero", "character")
+
+    with client.websocket_connect("/api/ws?since=1") as ws:
+        assert ws.receive_json() == {
+            "type": "change",
+            "seq": 2,
+            "entity_type": "asset",
+            "entity_id": 1,
+            "op": "insert",
+            "project_id": project.id,
+        }
+        studio.create_asset(project, "villain", "character")
+        assert ws.receive_json()["seq"] == 3
+
+
+def test_websocket_project_filter(client, studio):
+    film = studio.create_project("Film", "FILM")
+    other = studio.create_project("Other", "OTHER")
+    _wait_for_hub(studio)
+
+    with client.websocket_connect("/api/ws?project=FILM") as ws:
+        _wait_for_subscriber()
+        studio.create_asset(other, "skipped", "prop")
+        studio.create_asset(film, "kept", "prop")
+        message = ws.receive_json()
+        assert (message["entity_type"], message["project_id"]) == ("asset", film.id)
+
+
+def test_websocket_unknown_project_is_closed(client):
+    with pytest.raises(WebSocketDisconnect) as excinfo:
+        with client.websocket_connect("/api/ws?project=NOPE") as ws:
+            ws.receive_json()
+    assert excinfo.value.code == 4404
+
+
+def test_websocket_resync_when_queue_overflows(client, studio, monkeypatch):
+    monkeypatch.setattr(main.Subscriber, "QUEUE_SIZE", 5)
+    project = studio.create_project("Film", "FILM")
+    _wait_for_hub(studio)
+
+    with client.websocket_connect("/api/ws") as ws:
+        _wait_for_subscriber()
+        studio.create_assets_bulk(
+            project, [{"name": f"a{i}", "asset_type": "prop"} for i in range(20)]
+        )
+        assert ws.receive_json() == {"type": "resync"}
+        with pytest.raises(WebSocketDisconnect):
+            ws.receive_json()
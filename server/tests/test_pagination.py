@@ -0,0 +1,53 @@
+"""Keyset pagination and Link headers on list routes."""
+
+from urllib.parse import parse_qs, urlsplit
+
+
+def _next(response):
+    link = response.links.get("next")
+    return link["url"] if link else None
+
+
+def test_full_pages_link_to_the_next(client, studio):
+    for code in ("A", "B", "C"):
+        studio.create_project(code, code)
+
+    first = client.get("/api/projects", params={"limit": 2})
+    assert [p["code"] for p in first.json()] == ["A", "B"]
+    next_url = _next(first)
+    assert parse_qs(urlsplit(next_url).query) == {"limit": ["2"], "after": ["2"]}
+
+    second = client.get(next_url)
+    assert [p["code"] for p in second.json()] == ["C"]
+    assert _next(second) is None
+
+
+def test_link_keeps_filters(client, studio):
+    project = studio.create_project("Film", "FILM")
+    studio.create_assets_bulk(
+        project,
+        [{"name": f"a{i}", "asset_type": "prop" if i % 2 else "character"} for i in range(6)],
+    )
+
+    page = client.get("/api/projects/FILM/assets", params={"asset_type": "prop", "limit": 2})
+    query = parse_qs(urlsplit(_next(page)).query)
+    assert query["asset_type"] == ["prop"]
+    assert query["after"] == [str(page.json()[-1]["id"])]
+
+
+def test_default_page_size(client, studio):
+    project = studio.create_project("Film", "FILM")
+    studio.create_assets_bulk(
+        project, [{"name": f"a{i:04d}", "asset_type": "prop"} for i in range(1001)]
+    )
+
+    first = client.get("/api/projects/FILM/assets")
+    assert len(first.json()) == 1000
+    rest = client.get(_next(first))
+    assert [a["name"] for a in rest.json()] == ["a1000"]
+    assert _next(rest) is None
+
+
+def test_limit_is_bounded(client):
+    assert client.get("/api/projects", params={"limit": 1001}).status_code == 422
+    assert client.get("/api/projects", params={"limit": 0}).status_code == 422
@@ -1,7 +1,13 @@
-import { useState } from 'react'
+import { useEffect, useState } from 'react'
 import { QueryClient, QueryClientProvider, useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 
-const queryClient = new QueryClient()
+// Server-pushed change events (see useChangeEvents) invalidate queries, so
+// cached data stays fresh without refetching on every focus or mount.
+const queryClient = new QueryClient({
+  defaultOptions: {
+    queries: { staleTime: Infinity, refetchOnWindowFocus: false },
+  },
+})
 const API_BASE = '/api'
 
 // =============================================================================
@@ -35,26 +41,48 @@ interface Task {
   priority: number
 }
 
+interface Change {
+  seq: number
+  entity_type: 'project' | 'asset' | 'shot' | 'task' | 'version'
+  entity_id: number
+  op: 'insert' | 'update' | 'delete'
+  project_id?: number
+}
+
 // =============================================================================
 // API
 // =============================================================================
 
+// List routes return one page at a time; follow their Link: rel="next"
+// headers until the last page.
+async function fetchAll<T>(url: string, error: string): Promise<T[]> {
+  const items: T[] = []
+  let next: string | null = url
+  while (next) {
+    const res = await fetch(next)
+    if (!res.ok) throw new Error(error)
+    items.push(...(await res.json()))
+    next = null
+    const link = res.headers.get('Link')?.match(/<([^>]+)>;\s*rel="next"/)
+    if (link) {
+      // Keep requests same-origin: the server builds the link from its own URL.
+      const { pathname, search } = new URL(link[1], window.location.href)
+      next = pathname + search
+    }
+  }
+  return items
+}
+
 async function fetchProjects(): Promise<Project[]> {
-  const res = await fetch(`${API_BASE}/projects`)
-  if (!res.ok) throw new Error('Failed to fetch projects')
-  return res.json()
+  return fetchAll(`${API_BASE}/projects`, 'Failed to fetch projects')
 }
 
 async function fetchAssets(code: string): Promise<Asset[]> {
-  const res = await fetch(`${API_BASE}/projects/${code}/assets`)
-  if (!res.ok) throw new Error('Failed to fetch assets')
-  return res.json()
+  return fetchAll(`${API_BASE}/projects/${code}/assets`, 'Failed to fetch assets')
 }
 
 async function fetchTasks(assetId: number): Promise<Task[]> {
-  const res = await fetch(`${API_BASE}/assets/${assetId}/tasks`)
-  if (!res.ok) throw new Error('Failed to fetch tasks')
-  return res.json()
+  return fetchAll(`${API_BASE}/assets/${assetId}/tasks`, 'Failed to fetch tasks')
 }
 
 async function createProject(data: { name: string; code: string; description?: string }): Promise<Project> {
@@ -495,12 +523,57 @@ function CreateAssetModal({ projectCode, onClose }: { projectCode: string; onClo
   )
 }
 
+// =============================================================================
+// Live updates
+// =============================================================================
+
+const CHANGE_QUERY_KEYS: Partial<Record<Change['entity_type'], string>> = {
+  project: 'projects',
+  asset: 'assets',
+  task: 'tasks',
+}
+
+// Subscribe to /api/events and invalidate the queries a change touches.
+// EventSource reconnects on its own and sends Last-Event-ID, so the server
+// replays anything missed while disconnected.
+function useChangeEvents() {
+  const qc = useQueryClient()
+
+  useEffect(() => {
+    const source = new EventSource(`${API_BASE}/events`)
+    const pending = new Set<string>()
+    let timer: ReturnType<typeof setTimeout> | undefined
+
+    // Batch bursts (bulk imports) into one invalidation per query key.
+    const flush = () => {
+      timer = undefined
+      pending.forEach(key => qc.invalidateQueries({ queryKey: [key] }))
+      pending.clear()
+    }
+
+    source.addEventListener('change', e => {
+      const change: Change = JSON.parse((e as MessageEvent).data)
+      const key = CHANGE_QUERY_KEYS[change.entity_type]
+      if (!key) return
+      pending.add(key)
+      timer ??= setTimeout(flush, 200)
+    })
+    source.addEventListener('resync', () => qc.invalidateQueries())
+
+    return () => {
+      source.close()
+      clearTimeout(timer)
+    }
+  }, [qc])
+}
+
 // =============================================================================
 // Dashboard
 // =============================================================================
 
 function Dashboard() {
   const [view, setView] = useState<View>({ page: 'projects' })
+  useChangeEvents()
 
   const navItems = [
     { label: 'Projects', active: true },